@@ -0,0 +1,34 @@
+"""add contacts birthday indexes
+
+Revision ID: add_contacts_birthday_indexes
+Revises: add_user_role
+Create Date: 2026-08-30 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_contacts_birthday_indexes'
+down_revision: Union[str, None] = 'add_user_role'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_contacts_user_id', 'contacts', ['user_id'])
+    # Functional index matching the extract(month)/extract(day) filters in
+    # ContactRepository.get_contacts_by_birthday, so Postgres can use an
+    # index range scan instead of a seq scan per request.
+    op.execute(
+        "CREATE INDEX ix_contacts_user_bday ON contacts "
+        "(user_id, (extract(month from birthday)::int), (extract(day from birthday)::int))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX ix_contacts_user_bday")
+    op.drop_index('ix_contacts_user_id', table_name='contacts')
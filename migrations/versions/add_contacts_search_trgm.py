@@ -0,0 +1,32 @@
+"""add contacts trigram search index
+
+Revision ID: add_contacts_search_trgm
+Revises: add_contacts_birthday_indexes
+Create Date: 2026-08-30 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_contacts_search_trgm'
+down_revision: Union[str, None] = 'add_contacts_birthday_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Trigram index makes the leading-wildcard ILIKE in search_contacts
+    # indexable instead of a sequential scan.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_contacts_search_trgm ON contacts "
+        "USING gin ((name || ' ' || surname || ' ' || email) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX ix_contacts_search_trgm")
@@ -5,16 +5,24 @@ This module contains endpoints for registration, authentication, email confirmat
 and user account management.
 """
 
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.schemas import UserCreate, UserResponse, Token, RequestEmail, RequestPasswordReset, ResetPassword
-from src.services.auth import get_current_user, get_password_hash, verify_password, create_access_token, get_email_from_token, get_admin_user
+from src.services.auth import get_current_user, get_password_hash, verify_password, create_access_token, get_email_from_token, get_admin_user, bcrypt_limiter
 from src.services.users import UserService
 from src.services.email import send_email, send_reset_password_email
-from src.services.redis import cache_user, invalidate_user_cache
+from src.services.redis import (
+    cache_user_on_login,
+    get_cached_login_user,
+    refresh_login_user_ttl,
+    invalidate_user_cache,
+    cache_confirmed_email,
+    is_email_confirmed_cached,
+)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -42,21 +50,21 @@ async def register(
     """
     user_service = UserService(db)
     
-    existing_user = await user_service.get_user_by_email(body.email)
+    existing_user = await user_service.get_user_by_email_or_username(body.email, body.username)
     if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT, 
-            detail="A user with the email already exist"
-        )
-    
-    username_exists = await user_service.get_user_by_username(body.username)
-    if username_exists:
+        if existing_user.email == body.email:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A user with the email already exist"
+            )
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A user with the name already exist"
         )
     
-    hashed_password = get_password_hash(body.password)
+    hashed_password = await anyio.to_thread.run_sync(
+        get_password_hash, body.password, limiter=bcrypt_limiter
+    )
     body.password = hashed_password
     
     new_user = await user_service.create_user(body)
@@ -82,34 +90,52 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
     Raises:
         HTTPException: If authentication data is incorrect or email is not confirmed.
     """
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username(form_data.username)
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Bad login or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    if not verify_password(form_data.password, user.hashed_password):
+    # Warm path: skip the DB round-trip when login data is cached
+    cached_user = await get_cached_login_user(form_data.username)
+
+    if cached_user:
+        hashed_password = cached_user["hashed_password"]
+        confirmed = cached_user["confirmed"]
+        user = None
+    else:
+        user_service = UserService(db)
+        user = await user_service.get_user_by_username(form_data.username)
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Bad login or password",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        hashed_password = user.hashed_password
+        confirmed = user.confirmed
+
+    password_valid = await anyio.to_thread.run_sync(
+        verify_password, form_data.password, hashed_password, limiter=bcrypt_limiter
+    )
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Bad login or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    if not user.confirmed:
+
+    if not confirmed:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Email is not confirmed",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    # Cache user in Redis
-    await cache_user(user)
-    
-    access_token = await create_access_token(data={"sub": user.username})
+
+    if user is not None:
+        # Cache user in Redis for subsequent logins and /me requests
+        # (both keys go out in a single pipelined round-trip)
+        await cache_user_on_login(user)
+    else:
+        await refresh_login_user_ttl(form_data.username)
+
+    access_token = create_access_token(data={"sub": form_data.username})
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/confirmed_email/{token}")
@@ -127,7 +153,13 @@ async def confirmed_email(token: str, db: AsyncSession = Depends(get_db)):
     Raises:
         HTTPException: If the token is invalid or the user doesn't exist.
     """
-    email = await get_email_from_token(token)
+    email = get_email_from_token(token)
+
+    # Repeated clicks on the verification link are common: answer them
+    # from Redis without touching the database
+    if await is_email_confirmed_cached(email):
+        return {"message": "Your email is already confirmed"}
+
     user_service = UserService(db)
     user = await user_service.get_user_by_email(email)
     if user is None:
@@ -135,13 +167,15 @@ async def confirmed_email(token: str, db: AsyncSession = Depends(get_db)):
             status_code=status.HTTP_400_BAD_REQUEST, detail="Verification error"
         )
     if user.confirmed:
+        await cache_confirmed_email(email)
         return {"message": "Your email is already confirmed"}
-    
+
     await user_service.confirmed_email(email)
-    
+
+    await cache_confirmed_email(email)
     # Invalidate user cache as their status has changed
     await invalidate_user_cache(user.username)
-    
+
     return {"message": "Your email is  confirmed"}
 
 @router.post("/request_email")
@@ -230,7 +264,7 @@ async def reset_password(
         HTTPException: If the token is invalid or the user doesn't exist.
     """
     try:
-        email = await get_email_from_token(body.token)
+        email = get_email_from_token(body.token)
     except HTTPException:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -238,19 +272,18 @@ async def reset_password(
         )
     
     user_service = UserService(db)
-    user = await user_service.get_user_by_email(email)
-    
-    if not user:
+    # UPDATE ... RETURNING combines the existence check with the write
+    user = await user_service.update_password(email, body.password)
+
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User not found"
         )
-    
-    await user_service.update_password(email, body.password)
-    
+
     # Invalidate user cache as their password has changed
     await invalidate_user_cache(user.username)
-    
+
     return {"message": "Password successfully changed"}
 
 @router.get("/me", response_model=UserResponse)
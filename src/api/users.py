@@ -1,3 +1,4 @@
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, status, Request, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -7,7 +8,7 @@ from src.schemas import UserResponse
 from src.services.auth import get_current_user, get_admin_user
 from src.services.users import UserService
 from src.services.rate_limiter import RateLimiter
-from src.services.upload_file import UploadFileService
+from src.services.upload_file import UploadFileService, upload_limiter
 from src.conf.config import settings
 from src.services.redis import invalidate_user_cache
 
@@ -50,7 +51,11 @@ async def update_avatar(
         raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, 
                            detail="Поддерживаются только форматы изображений: jpeg, png, gif")
     
-    avatar_url = upload_service.upload_file(file, current_user.username)
+    # Cloudinary SDK робить блокуючий HTTP-запит — виносимо його в потік,
+    # щоб не зупиняти event loop на час завантаження.
+    avatar_url = await anyio.to_thread.run_sync(
+        upload_service.upload_file, file, current_user.username, limiter=upload_limiter
+    )
     
     user_service = UserService(db)
     user = await user_service.update_avatar_url(current_user.email, avatar_url)
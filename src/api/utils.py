@@ -6,10 +6,13 @@ from src.database.db import get_db
 
 router = APIRouter(tags=["utils"])
 
+# One TextClause built at import instead of per request
+_HEALTH_Q = text("SELECT 1")
+
 @router.get("/healthchecker")
 async def healthchecker(db: AsyncSession = Depends(get_db)):
     try:
-        result = await db.execute(text("SELECT 1"))
+        result = await db.execute(_HEALTH_Q)
         result = result.scalar_one_or_none()
 
         if result is None:
@@ -3,9 +3,14 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DB_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
+    BCRYPT_ROUNDS: int = 12
 
     MAIL_USERNAME: EmailStr
     MAIL_PASSWORD: str
@@ -25,6 +30,7 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_USER_TTL: int = 3600  # User cache lifetime
+    REDIS_LOGIN_TTL: int = 60  # Login cache lifetime (short to bound staleness)
 
     model_config = ConfigDict(
         extra="ignore", env_file=".env", env_file_encoding="utf-8", case_sensitive=True
@@ -6,12 +6,24 @@
 """
 
 from typing import List, Optional
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User, UserRole
 from src.schemas import UserCreate
 
+# Гарячі запити пошуку користувача, зібрані один раз на рівні модуля:
+# SQLAlchemy компілює їх у SQL лише при першому виконанні, а далі бере
+# з кеша скомпільованих запитів рушія.
+_STMT_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_STMT_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_STMT_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_STMT_BY_EMAIL_OR_USERNAME = (
+    select(User)
+    .where(or_(User.email == bindparam("email"), User.username == bindparam("username")))
+    .limit(1)
+)
+
 class UserRepository:
     """
     Репозиторій для управління користувачами в базі даних.
@@ -29,17 +41,36 @@ class UserRepository:
         """
         self.db = db
 
-    async def get_users(self) -> List[User]:
+    async def get_users(self, limit: int = 100, offset: int = 0) -> List[User]:
         """
-        Отримання списку всіх користувачів.
-        
+        Отримання сторінки списку користувачів.
+
+        Args:
+            limit: Максимальна кількість користувачів у відповіді.
+            offset: Кількість користувачів, які потрібно пропустити.
+
         Returns:
-            Список всіх користувачів.
+            Список користувачів у межах сторінки.
         """
-        stmt = select(User)
+        stmt = select(User).order_by(User.id).limit(limit).offset(offset)
         users = await self.db.execute(stmt)
         return users.scalars().all()
 
+    async def stream_users(self, batch_size: int = 100):
+        """
+        Потокове читання всіх користувачів без завантаження таблиці в пам'ять.
+
+        Args:
+            batch_size: Розмір партії рядків, які драйвер тримає в пам'яті.
+
+        Yields:
+            Користувачі по одному.
+        """
+        stmt = select(User).order_by(User.id).execution_options(yield_per=batch_size)
+        result = await self.db.stream_scalars(stmt)
+        async for user in result:
+            yield user
+
     async def get_user(self, user_id: int) -> User | None:
         """
         Отримання користувача за його ідентифікатором.
@@ -50,8 +81,7 @@ class UserRepository:
         Returns:
             Користувач із вказаним ідентифікатором або None, якщо користувача не знайдено.
         """
-        stmt = select(User).filter_by(id=user_id)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_STMT_BY_ID, {"user_id": user_id})
         return user.scalar_one_or_none()
 
     async def get_user_by_email(self, email: str) -> User | None:
@@ -64,8 +94,7 @@ class UserRepository:
         Returns:
             Користувач із вказаним email або None, якщо користувача не знайдено.
         """
-        stmt = select(User).filter_by(email=email)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_STMT_BY_EMAIL, {"email": email})
         return user.scalar_one_or_none()
 
     async def get_user_by_username(self, username: str) -> User | None:
@@ -78,8 +107,23 @@ class UserRepository:
         Returns:
             Користувач із вказаним іменем або None, якщо користувача не знайдено.
         """
-        stmt = select(User).filter_by(username=username)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_STMT_BY_USERNAME, {"username": username})
+        return user.scalar_one_or_none()
+
+    async def get_user_by_email_or_username(self, email: str, username: str) -> User | None:
+        """
+        Отримання користувача за email або іменем користувача одним запитом.
+
+        Args:
+            email: Email користувача.
+            username: Ім'я користувача.
+
+        Returns:
+            Користувач із вказаним email або іменем, або None, якщо користувача не знайдено.
+        """
+        user = await self.db.execute(
+            _STMT_BY_EMAIL_OR_USERNAME, {"email": email, "username": username}
+        )
         return user.scalar_one_or_none()
 
     async def create_user(self, user_data: UserCreate) -> User:
@@ -113,40 +157,58 @@ class UserRepository:
         Returns:
             None
         """
-        user = await self.get_user_by_email(email)
-        user.confirmed = True
+        # Один UPDATE без попереднього SELECT — статус не потрібен викликачам
+        stmt = update(User).where(User.email == email).values(confirmed=True)
+        await self.db.execute(stmt)
         await self.db.commit()
         
-    async def update_avatar_url(self, email: str, url: str) -> User:
+    async def update_avatar_url(self, email: str, url: str) -> User | None:
         """
         Оновлення URL аватару користувача.
-        
+
         Args:
             email: Email користувача.
             url: Новий URL аватару.
-            
+
         Returns:
-            Оновлений користувач.
-        """
-        user = await self.get_user_by_email(email)
-        user.avatar = url
+            Оновлений користувач або None, якщо користувача не знайдено.
+        """
+        # Один UPDATE ... RETURNING замість SELECT + UPDATE + refresh
+        stmt = (
+            update(User)
+            .where(User.email == email)
+            .values(avatar=url)
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        if user is not None:
+            self.db.expunge(user)
         await self.db.commit()
-        await self.db.refresh(user)
         return user
         
-    async def update_password(self, email: str, hashed_password: str) -> User:
+    async def update_password(self, email: str, hashed_password: str) -> User | None:
         """
         Оновлення пароля користувача.
-        
+
         Args:
             email: Email користувача.
             hashed_password: Новий хешований пароль.
-            
+
         Returns:
-            Оновлений користувач.
-        """
-        user = await self.get_user_by_email(email)
-        user.hashed_password = hashed_password
+            Оновлений користувач або None, якщо користувача не знайдено.
+        """
+        # Один UPDATE ... RETURNING замість SELECT + UPDATE + refresh:
+        # відсутність рядка у відповіді означає, що користувача немає.
+        stmt = (
+            update(User)
+            .where(User.email == email)
+            .values(hashed_password=hashed_password)
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        if user is not None:
+            self.db.expunge(user)
         await self.db.commit()
-        await self.db.refresh(user)
-        return user 
\ No newline at end of file
+        return user
@@ -5,11 +5,26 @@ This module contains Pydantic classes for data validation and serialization in t
 """
 
 from datetime import date
-from typing import Optional, List
-from pydantic import BaseModel, Field, EmailStr, ConfigDict
+from typing import Annotated, Optional, List
+
+from emval import EmailValidator
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict
 
 from src.database.models import UserRole
 
+# Rust-backed syntax-only email validation: orders of magnitude cheaper
+# than EmailStr's email-validator on every request body. Deliverability
+# checks are off, matching EmailStr's behaviour of not touching DNS.
+_email_validator = EmailValidator(deliverable_address=False)
+
+def _validate_email(value: str) -> str:
+    try:
+        return _email_validator.validate_email(value).normalized
+    except Exception as exc:
+        raise ValueError(f"value is not a valid email address: {exc}")
+
+Email = Annotated[str, AfterValidator(_validate_email)]
+
 # User schemas
 class UserBase(BaseModel):
     """
@@ -20,7 +35,7 @@ class UserBase(BaseModel):
         email: User's email.
     """
     username: str = Field(min_length=2, max_length=50)
-    email: EmailStr
+    email: Email
 
 class UserCreate(UserBase):
     """
@@ -43,8 +58,10 @@ class UserResponse(UserBase):
     id: int
     avatar: Optional[str] = None
     role: UserRole
-    
-    model_config = ConfigDict(from_attributes=True)
+
+    # Built on every authenticated request: frozen slotted instances are
+    # cheaper to construct and safe to share from the cache
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 class UserInDB(UserBase):
     """
@@ -65,7 +82,7 @@ class RequestEmail(BaseModel):
     Attributes:
         email: Email for verification.
     """
-    email: EmailStr
+    email: Email
 
 # Password reset schemas
 class RequestPasswordReset(BaseModel):
@@ -75,7 +92,7 @@ class RequestPasswordReset(BaseModel):
     Attributes:
         email: User's email for password reset.
     """
-    email: EmailStr
+    email: Email
 
 class ResetPassword(BaseModel):
     """
@@ -109,6 +126,8 @@ class TokenData(BaseModel):
     """
     username: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 # Contact schemas
 class ContactBase(BaseModel):
     """
@@ -124,7 +143,7 @@ class ContactBase(BaseModel):
     """
     name: str = Field(max_length=50)
     surname: str = Field(max_length=50)
-    email: EmailStr
+    email: Email
     phone: str = Field(max_length=20)
     birthday: date
     additional_data: Optional[str] = Field(default=None, max_length=500)
@@ -143,7 +162,7 @@ class ContactUpdate(ContactBase):
     """
     name: Optional[str] = Field(default=None, max_length=50)
     surname: Optional[str] = Field(default=None, max_length=50)
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     phone: Optional[str] = Field(default=None, max_length=20)
     birthday: Optional[date] = None
     additional_data: Optional[str] = Field(default=None, max_length=500)
@@ -158,5 +177,7 @@ class ContactResponse(ContactBase):
     """
     id: int
     user_id: int
-    
-    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
+
+    # Hot on contact listings — same construction-cost trimming as
+    # UserResponse
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
@@ -1,11 +1,14 @@
-from datetime import datetime, timedelta
-from datetime import timezone as tz
+import asyncio
+import os
+import time
+from collections import OrderedDict
 from typing import Optional
 
+import anyio
+import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.conf.config import settings
@@ -13,48 +16,93 @@ from src.database.db import get_db
 from src.database.models import UserRole
 from src.repository.users import UserRepository
 from src.schemas import TokenData, UserResponse
-from src.services.redis import get_cached_user, cache_user
+from src.services.redis import get_cached_user_and_touch, cache_user
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt is pure CPU: cap its worker threads at the core count so password
+# hashing cannot monopolize the shared thread pool under burst traffic
+bcrypt_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Процес-локальний TTL-кеш розібраних access-токенів: той самий bearer-токен
+# повторюється тисячі разів за сесію, тож HMAC-перевірка і JSON-розбір
+# виконуються раз на токен на хвилину. Токени — секрети, тому кеш
+# не виходить за межі процесу (жодного Redis).
+_TOKEN_CACHE_MAX = 10_000
+_TOKEN_CACHE_TTL = 60
+_token_cache: OrderedDict = OrderedDict()
+
+# Single-flight: одночасні промахи кеша по тому самому користувачу ділять
+# один SELECT замість N однакових запитів до бази
+_inflight: dict = {}
+
+def _decode_token_cached(token: str) -> Optional[str]:
+    """Повертає claim sub токена, кешуючи результат jwt.decode."""
+    now = time.time()
+    entry = _token_cache.get(token)
+    if entry is not None:
+        username, exp, cached_until = entry
+        if cached_until > now:
+            if exp is not None and exp <= now:
+                return None
+            return username
+        del _token_cache[token]
+
+    try:
+        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+    except jwt.InvalidTokenError:
+        return None
+
+    username = payload.get("sub")
+    if username is None:
+        return None
+
+    _token_cache[token] = (username, payload.get("exp"), now + _TOKEN_CACHE_TTL)
+    _token_cache.move_to_end(token)
+    if len(_token_cache) > _TOKEN_CACHE_MAX:
+        _token_cache.popitem(last=False)
+    return username
+
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    # Пряме звернення до C-розширення bcrypt без passlib-диспетчеризації
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode(), bcrypt.gensalt(settings.BCRYPT_ROUNDS)
+    ).decode()
 
-async def create_access_token(data: dict, expires_delta: Optional[float] = None):
+def create_access_token(data: dict, expires_delta: Optional[float] = None):
     to_encode = data.copy()
+    # RFC 7519 NumericDate — цілі секунди epoch без проміжних datetime-об'єктів
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.now(tz.UTC) + timedelta(seconds=expires_delta)
+        to_encode["exp"] = now + int(expires_delta)
     else:
-        expire = datetime.now(tz.UTC) + timedelta(seconds=settings.JWT_EXPIRATION_SECONDS)
-    to_encode.update({"exp": expire})
+        to_encode["exp"] = now + settings.JWT_EXPIRATION_SECONDS
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
-async def create_email_token(data: dict):
+def create_email_token(data: dict):
     to_encode = data.copy()
-    expire = datetime.now(tz.UTC) + timedelta(days=7)
-    to_encode.update({"iat": datetime.now(tz.UTC), "exp": expire})
+    now = int(time.time())
+    to_encode.update({"iat": now, "exp": now + 7 * 24 * 3600})
     token = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
     return token
 
-async def create_reset_password_token(data: dict):
+def create_reset_password_token(data: dict):
     to_encode = data.copy()
-    expire = datetime.now(tz.UTC) + timedelta(hours=1)
-    to_encode.update({"iat": datetime.now(tz.UTC), "exp": expire})
+    now = int(time.time())
+    to_encode.update({"iat": now, "exp": now + 3600})
     token = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
     return token
 
-async def get_email_from_token(token: str):
+def get_email_from_token(token: str):
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
         email = payload["sub"]
         return email
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Invalid token for email confirmation",
@@ -66,32 +114,46 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
         detail="Failed to verify credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = TokenData(username=username)
-    except JWTError:
+    username = _decode_token_cached(token)
+    if username is None:
         raise credentials_exception
+    token_data = TokenData(username=username)
     
-    # Try to get user from cache
-    cached_user = await get_cached_user(token_data.username)
+    # Try to get user from cache (GET + sliding EXPIRE in one round-trip)
+    cached_user = await get_cached_user_and_touch(token_data.username)
     
     if cached_user:
-        user = UserResponse(**cached_user)
+        # Кешований blob записали ми самі — повторна валідація (особливо
+        # EmailStr) на кожному запиті зайва
+        user = UserResponse.model_construct(**cached_user)
         return user
     
-    # If user is not in cache, get from database
-    user_repository = UserRepository(db)
-    user = await user_repository.get_user_by_username(token_data.username)
-    
+    # If user is not in cache, get from database. The first concurrent
+    # miss runs the query; the rest await its Future.
+    fut = _inflight.get(token_data.username)
+    if fut is not None:
+        user = await fut
+    else:
+        fut = asyncio.get_running_loop().create_future()
+        _inflight[token_data.username] = fut
+        try:
+            user_repository = UserRepository(db)
+            user = await user_repository.get_user_by_username(token_data.username)
+        except BaseException as exc:
+            fut.set_exception(exc)
+            fut.exception()  # mark as retrieved in case nobody is waiting
+            raise
+        finally:
+            _inflight.pop(token_data.username, None)
+        fut.set_result(user)
+
+        if user is not None:
+            # Cache user for subsequent requests
+            await cache_user(user)
+
     if user is None:
         raise credentials_exception
-    
-    # Cache user for subsequent requests
-    await cache_user(user)
-    
+
     return user
 
 async def get_admin_user(current_user: UserResponse = Depends(get_current_user)):
@@ -17,6 +17,9 @@ class ContactService:
     async def create_contact(self, body: ContactModel, user_id: int):
         return await self.repository.create_contact(body, user_id)
 
+    async def create_contacts_bulk(self, bodies: List[ContactModel], user_id: int):
+        return await self.repository.create_contacts_bulk(bodies, user_id)
+
     async def update_contact(self, contact_id: int, body: ContactUpdate, user_id: int):
         return await self.repository.update_contact(contact_id, body, user_id)
 
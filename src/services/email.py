@@ -23,7 +23,7 @@ conf = ConnectionConfig(
 
 async def send_email(email: EmailStr, username: str, host: str):
     try:
-        token_verification = await create_email_token({"sub": email})
+        token_verification = create_email_token({"sub": email})
         message = MessageSchema(
             subject="Email Confirmation",
             recipients=[email],
@@ -42,7 +42,7 @@ async def send_email(email: EmailStr, username: str, host: str):
 
 async def send_reset_password_email(email: EmailStr, username: str, host: str):
     try:
-        token_reset = await create_reset_password_token({"sub": email})
+        token_reset = create_reset_password_token({"sub": email})
         message = MessageSchema(
             subject="Password Reset",
             recipients=[email],
@@ -1,31 +1,91 @@
 import time
+from collections import deque
 from fastapi import Request, HTTPException, status
-from typing import Callable, Dict, Optional
+from typing import Callable, Deque, Dict, Optional
+
+import redis
+
+from src.services.redis import redis_client
+
+# Атомарно інкрементує лічильник і виставляє TTL на першому зверненні —
+# один round-trip до Redis замість окремих INCR + EXPIRE.
+RATE_LIMIT_LUA = (
+    "local c = redis.call('INCR', KEYS[1]) "
+    "if c == 1 then redis.call('EXPIRE', KEYS[1], ARGV[1]) end "
+    "return c"
+)
 
 class RateLimiter:
-    def __init__(self, times: int = 10, seconds: int = 60):
-        self.times = times  
-        self.seconds = seconds  
-        self.requests: Dict[str, list] = {} 
-    
+    def __init__(self, times: int = 10, seconds: int = 60,
+                 time_func: Callable[[], float] = time.monotonic):
+        self.times = times
+        self.seconds = seconds
+        # Ін'єкція годинника: тести просувають вікно без реального sleep
+        self.time_func = time_func
+        self.requests: Dict[str, Deque[float]] = {}
+        self._script_sha: Optional[str] = None
+        self._unavailable_client = None
+        # Готовий екземпляр виключення: на гарячому шляху відмови не
+        # платимо за алокацію та форматування рядка на кожен запит
+        self._too_many_exc = HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Слишком много запросов. Пожалуйста, попробуйте снова через {seconds} секунд."
+        )
+
     async def __call__(self, request: Request, endpoint: Optional[str] = None):
         ip = request.client.host
         path = request.url.path if not endpoint else endpoint
         key = f"{ip}:{path}"
-        
-        now = time.time()
-        
+
+        count = await self._redis_count(key)
+        if count is None:
+            # Redis недоступний — рахуємо у пам'яті процесу
+            count = self._local_count(key)
+
+        if count > self.times:
+            raise self._too_many_exc from None
+
+        return True
+
+    async def _redis_count(self, key: str) -> Optional[int]:
+        """Лічильник у Redis через кешований Lua-скрипт (EVALSHA, один RTT)."""
+        if redis_client is self._unavailable_client:
+            return None
+        try:
+            if self._script_sha is None:
+                self._script_sha = await redis_client.script_load(RATE_LIMIT_LUA)
+            return int(await redis_client.evalsha(
+                self._script_sha, 1, f"rate:{key}", self.seconds
+            ))
+        except redis.exceptions.NoScriptError:
+            self._script_sha = await redis_client.script_load(RATE_LIMIT_LUA)
+            return int(await redis_client.evalsha(
+                self._script_sha, 1, f"rate:{key}", self.seconds
+            ))
+        except redis.RedisError:
+            # Запам'ятовуємо недоступний клієнт, щоб не платити за
+            # таймаут з'єднання на кожному запиті
+            self._unavailable_client = redis_client
+            self._script_sha = None
+            return None
+
+    def _local_count(self, key: str) -> int:
+        # Ковзне вікно на deque: прострочені мітки знімаються зліва за
+        # O(1), без перебудови списку на кожному запиті; monotonic не
+        # залежить від стрибків системного годинника
+        now = self.time_func()
+        cutoff = now - self.seconds
+
         if key not in self.requests:
-            self.requests[key] = []
-        
-        self.requests[key] = [timestamp for timestamp in self.requests[key] if now - timestamp < self.seconds]
-        
-        if len(self.requests[key]) >= self.times:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Слишком много запросов. Пожалуйста, попробуйте снова через {self.seconds} секунд."
-            )
-        
-        self.requests[key].append(now)
-        
-        return True 
\ No newline at end of file
+            self.requests[key] = deque()
+        window = self.requests[key]
+
+        while window and window[0] < cutoff:
+            window.popleft()
+
+        if len(window) >= self.times:
+            return self.times + 1
+
+        window.append(now)
+
+        return len(window)
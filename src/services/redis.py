@@ -5,20 +5,22 @@ This module provides functions for connecting to Redis and performing
 caching operations for users and other data.
 """
 
-import json
 from typing import Optional
 
-import redis
+import msgpack
+import redis.asyncio as redis
 from fastapi import Depends
 
 from src.conf.config import settings
 from src.schemas import UserResponse
 
-# Creating global Redis connection
+# Creating global Redis connection (async client — commands are awaited
+# instead of blocking the event loop on socket reads). Values are binary
+# MessagePack payloads, so responses are not decoded to str.
 redis_client = redis.Redis(
     host=settings.REDIS_HOST,
     port=settings.REDIS_PORT,
-    decode_responses=True
+    decode_responses=False
 )
 
 async def get_redis_client():
@@ -37,13 +39,24 @@ async def cache_user(user: UserResponse) -> None:
     Args:
         user: User to cache.
     """
-    user_data = user.model_dump()
+    # Explicit field list works for both UserResponse and ORM User objects;
+    # msgpack (C extension) is noticeably cheaper than json on this hot path
+    user_data = {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "avatar": user.avatar,
+        "role": user.role,
+    }
     key = f"user:{user.username}"
-    redis_client.setex(
-        key, 
-        settings.REDIS_USER_TTL, 
-        json.dumps(user_data)
-    )
+    try:
+        await redis_client.setex(
+            key,
+            settings.REDIS_USER_TTL,
+            msgpack.packb(user_data, use_bin_type=True)
+        )
+    except redis.RedisError:
+        pass
 
 async def get_cached_user(username: str) -> Optional[dict]:
     """
@@ -56,13 +69,142 @@ async def get_cached_user(username: str) -> Optional[dict]:
         User data from cache or None if user is not found in cache.
     """
     key = f"user:{username}"
-    cached_user = redis_client.get(key)
-    
+    cached_user = await redis_client.get(key)
+
     if cached_user:
-        return json.loads(cached_user)
-    
+        return msgpack.unpackb(cached_user, raw=False)
+
     return None
 
+async def get_cached_user_and_touch(username: str) -> Optional[dict]:
+    """
+    Get cached user data and slide its TTL in one round-trip.
+
+    Pipelines GET + EXPIRE so an active user's cache entry stays warm
+    without paying a second Redis RTT per request.
+
+    Args:
+        username: Username.
+
+    Returns:
+        User data from cache or None if user is not found in cache.
+    """
+    key = f"user:{username}"
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.expire(key, settings.REDIS_USER_TTL)
+        cached_user, _ = await pipe.execute()
+    except redis.RedisError:
+        # A cache outage must not break authenticated requests; fall
+        # back to the database path
+        return None
+
+    if cached_user:
+        return msgpack.unpackb(cached_user, raw=False)
+
+    return None
+
+async def cache_user_on_login(user) -> None:
+    """
+    Cache the public user payload and the login data in one round-trip.
+
+    A successful login wants both user:{username} and login:{username}
+    populated; a pipeline sends the two SETEX commands together instead
+    of paying two network round-trips. The login key is short-lived
+    because it carries the password hash and confirmation flag.
+
+    Args:
+        user: ORM user to cache.
+    """
+    user_data = {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "avatar": user.avatar,
+        "role": user.role,
+    }
+    login_data = dict(user_data, hashed_password=user.hashed_password, confirmed=user.confirmed)
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.setex(
+            f"user:{user.username}",
+            settings.REDIS_USER_TTL,
+            msgpack.packb(user_data, use_bin_type=True),
+        )
+        pipe.setex(
+            f"login:{user.username}",
+            settings.REDIS_LOGIN_TTL,
+            msgpack.packb(login_data, use_bin_type=True),
+        )
+        await pipe.execute()
+    except redis.RedisError:
+        pass
+
+async def get_cached_login_user(username: str) -> Optional[dict]:
+    """
+    Get cached login data for a user.
+
+    A cache failure must never break login, so Redis errors fall back
+    to the database path by returning None.
+
+    Args:
+        username: Username.
+
+    Returns:
+        Login data from cache or None if unavailable.
+    """
+    key = f"login:{username}"
+    try:
+        cached_user = await redis_client.get(key)
+    except redis.RedisError:
+        return None
+
+    if cached_user:
+        return msgpack.unpackb(cached_user, raw=False)
+
+    return None
+
+async def refresh_login_user_ttl(username: str) -> None:
+    """
+    Refresh the login cache TTL after a successful verification.
+
+    Args:
+        username: Username.
+    """
+    key = f"login:{username}"
+    try:
+        await redis_client.expire(key, settings.REDIS_LOGIN_TTL)
+    except redis.RedisError:
+        pass
+
+async def cache_confirmed_email(email: str) -> None:
+    """
+    Remember that an email address has been confirmed.
+
+    Args:
+        email: Confirmed email address.
+    """
+    try:
+        await redis_client.set(f"confirmed:{email}", "1", ex=86400)
+    except redis.RedisError:
+        pass
+
+async def is_email_confirmed_cached(email: str) -> bool:
+    """
+    Check the confirmed-email cache.
+
+    Args:
+        email: Email address.
+
+    Returns:
+        True if the email is known to be confirmed, False otherwise.
+    """
+    try:
+        return bool(await redis_client.get(f"confirmed:{email}"))
+    except redis.RedisError:
+        return False
+
 async def invalidate_user_cache(username: str) -> None:
     """
     Invalidate user cache.
@@ -70,5 +212,7 @@ async def invalidate_user_cache(username: str) -> None:
     Args:
         username: Username.
     """
-    key = f"user:{username}"
-    redis_client.delete(key) 
\ No newline at end of file
+    try:
+        await redis_client.delete(f"user:{username}", f"login:{username}")
+    except redis.RedisError:
+        pass
@@ -1,6 +1,11 @@
+import anyio
 import cloudinary
 import cloudinary.uploader
 
+# Blocking Cloudinary uploads get their own thread budget, separate from
+# the bcrypt limiter, so slow uploads cannot queue behind password hashing
+upload_limiter = anyio.CapacityLimiter(8)
+
 class UploadFileService:
     def __init__(self, cloud_name, api_key, api_secret):
         self.cloud_name = cloud_name
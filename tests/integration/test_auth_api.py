@@ -1,30 +1,37 @@
-import pytest
-import asyncio
-from unittest.mock import patch, MagicMock
+import uuid
+from unittest.mock import patch
+from urllib.parse import urlencode
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.models import User
-from src.services.auth import get_password_hash, create_access_token, create_email_token
+from tests._helpers import User, create_email_token
 
+# Static login payloads encoded once at import instead of per request
+LOGIN_OK_BODY = urlencode({"username": "testlogin@example.com", "password": "password123"}).encode()
+LOGIN_WRONG_PASSWORD_BODY = urlencode({"username": "wrongpass@example.com", "password": "wrongpassword"}).encode()
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
 
-def test_register_user(test_client, async_session):
-    # Prepare data for registration
+
+async def test_register_user(client, async_session):
+    # Prepare data for registration; unique identity so parallel workers
+    # never collide on the unique columns
+    suffix = uuid.uuid4().hex[:8]
     user_data = {
-        "username": "newuser",
-        "email": "newuser@example.com",
+        "username": f"newuser_{suffix}",
+        "email": f"newuser_{suffix}@example.com",
         "password": "password123"
     }
-    
-    # Create mock for email sending function
-    with patch("src.api.auth.send_email") as mock_send_email:
-        # Set the mock to not perform actual sending
-        mock_send_email.return_value = None
-        
+
+    # Replace email sending with a plain async no-op that counts calls
+    send_calls = []
+
+    async def _noop_send_email(*args, **kwargs):
+        send_calls.append(args)
+
+    with patch("src.api.auth.send_email", _noop_send_email):
         # Execute registration request
-        response = test_client.post("/api/auth/register", json=user_data)
-        
+        response = await client.post("/api/auth/register", json=user_data)
+
         # Check result
         assert response.status_code == 201
         data = response.json()
@@ -32,58 +39,41 @@ def test_register_user(test_client, async_session):
         assert data["email"] == user_data["email"]
         assert data["username"] == user_data["username"]
         assert "password" not in data
-        
-        # Check that user is created in database
-        event_loop = asyncio.get_event_loop()
-        
-        async def verify_user():
-            stmt = select(User).filter_by(email=user_data["email"])
-            result = await async_session.execute(stmt)
-            db_user = result.scalar_one_or_none()
-            return db_user
-            
-        db_user = event_loop.run_until_complete(verify_user())
-        assert db_user is not None
-        assert db_user.username == user_data["username"]
-        assert not db_user.confirmed  # Email not confirmed
-        
+
+        # Check that user is created in database; selecting only the
+        # checked columns skips ORM instance hydration
+        row = (await async_session.execute(
+            select(User.username, User.confirmed).where(User.id == data["id"])
+        )).one_or_none()
+        assert row is not None
+        assert row.username == user_data["username"]
+        assert not row.confirmed  # Email not confirmed
+
         # Check that email sending function was called
-        mock_send_email.assert_called_once()
+        assert len(send_calls) == 1
 
 
-def test_login_user(test_client, async_session):
-    # Create user
-    event_loop = asyncio.get_event_loop()
-    
+async def test_login_user(client, async_session, hashed_password123):
     # Username, email and password for test user
     username = "testlogin"
     email = "testlogin@example.com"
     password = "password123"
-    
-    async def create_user():
-        # Hash the password
-        hashed_password = get_password_hash(password)
-        
-        # Create user in database
-        user = User(username=username, email=email, hashed_password=hashed_password, confirmed=True)
-        async_session.add(user)
-        await async_session.commit()
-    
-    event_loop.run_until_complete(create_user())
-    
-    # Prepare data for login
-    login_data = {
-        "username": email,
-        "password": password
-    }
-    
-    # Execute login request
-    response = test_client.post(
-        "/api/auth/login", 
-        data=login_data,
-        headers={"Content-Type": "application/x-www-form-urlencoded"}
+
+    # Reuse the session-scoped hash instead of re-running bcrypt
+    hashed_password = hashed_password123
+
+    # Create user in database
+    user = User(username=username, email=email, hashed_password=hashed_password, confirmed=True)
+    async_session.add(user)
+    await async_session.commit()
+
+    # Execute login request with the pre-encoded form body
+    response = await client.post(
+        "/api/auth/login",
+        content=LOGIN_OK_BODY,
+        headers=FORM_HEADERS
     )
-    
+
     # Check result
     assert response.status_code == 200
     data = response.json()
@@ -91,39 +81,27 @@ def test_login_user(test_client, async_session):
     assert data["token_type"] == "bearer"
 
 
-def test_login_wrong_password(test_client, async_session):
-    # Create user
-    event_loop = asyncio.get_event_loop()
-    
+async def test_login_wrong_password(client, async_session, hashed_correctpassword):
     # Username, email and password for test user
     username = "wrongpasstest"
     email = "wrongpass@example.com"
     password = "correctpassword"
-    
-    async def create_user():
-        # Hash the password
-        hashed_password = get_password_hash(password)
-        
-        # Create user in database
-        user = User(username=username, email=email, hashed_password=hashed_password, confirmed=True)
-        async_session.add(user)
-        await async_session.commit()
-    
-    event_loop.run_until_complete(create_user())
-    
-    # Prepare data for login with incorrect password
-    login_data = {
-        "username": email,
-        "password": "wrongpassword"
-    }
-    
-    # Execute login request
-    response = test_client.post(
-        "/api/auth/login", 
-        data=login_data,
-        headers={"Content-Type": "application/x-www-form-urlencoded"}
+
+    # Reuse the session-scoped hash instead of re-running bcrypt
+    hashed_password = hashed_correctpassword
+
+    # Create user in database
+    user = User(username=username, email=email, hashed_password=hashed_password, confirmed=True)
+    async_session.add(user)
+    await async_session.commit()
+
+    # Execute login request with the pre-encoded form body
+    response = await client.post(
+        "/api/auth/login",
+        content=LOGIN_WRONG_PASSWORD_BODY,
+        headers=FORM_HEADERS
     )
-    
+
     # Check result
     assert response.status_code == 401
     data = response.json()
@@ -131,43 +109,36 @@ def test_login_wrong_password(test_client, async_session):
     assert data["detail"] == "Invalid email or password"
 
 
-def test_confirmed_email(test_client, async_session):
-    # Create user with unconfirmed email
-    event_loop = asyncio.get_event_loop()
-    
+async def test_confirmed_email(client, async_session, hashed_password123):
     # Username, email and password for test user
     username = "confirmtest"
     email = "confirm@example.com"
     password = "password123"
-    
-    async def create_user_and_token():
-        # Hash the password
-        hashed_password = get_password_hash(password)
-        
-        # Create user in database with confirmed=False
-        user = User(username=username, email=email, hashed_password=hashed_password, confirmed=False)
-        async_session.add(user)
-        await async_session.commit()
-        
-        # Create token for email confirmation
-        token = await create_email_token({"sub": email})
-        return token
-    
-    token = event_loop.run_until_complete(create_user_and_token())
-    
+
+    # Reuse the session-scoped hash instead of re-running bcrypt
+    hashed_password = hashed_password123
+
+    # Create user in database with confirmed=False
+    user = User(username=username, email=email, hashed_password=hashed_password, confirmed=False)
+    async_session.add(user)
+    await async_session.flush()
+    user_id = user.id
+    await async_session.commit()
+
+    # Create token for email confirmation
+    token = create_email_token({"sub": email})
+
     # Execute email confirmation request
-    response = test_client.get(f"/api/auth/confirmed_email/{token}")
-    
+    response = await client.get(f"/api/auth/confirmed_email/{token}")
+
     # Check result
     assert response.status_code == 200
     data = response.json()
     assert data["message"] == "Email confirmed"
-    
-    # Check that user's email is confirmed in database
-    async def verify_confirmed():
-        stmt = select(User).filter_by(email=email)
-        result = await async_session.execute(stmt)
-        db_user = result.scalar_one_or_none()
-        return db_user.confirmed
-        
-    assert event_loop.run_until_complete(verify_confirmed()) is True 
\ No newline at end of file
+
+    # Check that user's email is confirmed in database; a column-only
+    # select avoids re-hydrating the full User row
+    row = (await async_session.execute(
+        select(User.confirmed).where(User.id == user_id)
+    )).one()
+    assert row.confirmed is True
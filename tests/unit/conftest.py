@@ -0,0 +1,84 @@
+import pytest
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from fastapi import UploadFile
+
+from src.schemas import UserCreate, ContactModel, ContactUpdate
+from tests._helpers import UserStub, ContactStub
+
+
+@pytest.fixture(scope="session")
+def mock_user():
+    """Подтвержденный пользователь для тестов endpoint-ов"""
+    return UserStub()
+
+
+@pytest.fixture(scope="session")
+def mock_contact():
+    """Контакт для тестов endpoint-ов"""
+    return ContactStub()
+
+
+class _FakeRequest:
+    """Лёгкий стаб вместо MagicMock(spec=Request): спека заставляет mock
+    обходить все дескрипторы starlette.Request при каждом построении"""
+    base_url = "http://test-server.com/"
+
+
+@pytest.fixture(scope="module")
+def fake_request():
+    """Стаб Request с base_url — всё, что нужно эндпоинтам"""
+    return _FakeRequest()
+
+
+@pytest.fixture(scope="session")
+def db_sentinel():
+    """Заглушка вместо AsyncMock() для db: сервисы замоканы, сессию никто
+    не трогает, поэтому достаточно одного инертного объекта"""
+    return object()
+
+
+@pytest.fixture
+def fake_background_tasks():
+    """Стаб BackgroundTasks: только add_task, и тот — обычный MagicMock"""
+    return SimpleNamespace(add_task=MagicMock())
+
+
+@pytest.fixture(scope="module")
+def user_create_body():
+    """UserCreate, прошедший валидацию один раз на модуль"""
+    return UserCreate(username="testuser", email="test@example.com", password="password123")
+
+
+@pytest.fixture(scope="module")
+def contact_model_body():
+    """ContactModel, прошедший валидацию один раз на модуль"""
+    return ContactModel(
+        name="John",
+        surname="Doe",
+        email="john@example.com",
+        phone="1234567890",
+        birthday=date(1990, 1, 1)
+    )
+
+
+@pytest.fixture(scope="module")
+def contact_update_body():
+    """ContactUpdate, прошедший валидацию один раз на модуль"""
+    return ContactUpdate(
+        name="John Updated",
+        surname="Doe Updated"
+    )
+
+
+@pytest.fixture
+def upload_file_mock():
+    """Spec'd UploadFile mock shared by the upload tests. Built per test:
+    copy.copy on a MagicMock routes through __copy__ and hands back the
+    same child object every time, so copies would share state"""
+    mock_file = MagicMock(spec=UploadFile)
+    mock_file.file = MagicMock()
+    mock_file.filename = "test.jpg"
+    return mock_file
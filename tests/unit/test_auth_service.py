@@ -1,14 +1,22 @@
 import pytest
-from unittest.mock import patch
 from fastapi import HTTPException
-from jose import JWTError
+from jwt import InvalidTokenError
 
 from src.services.auth import (
     get_password_hash, verify_password, get_email_from_token
 )
 
 
-def test_get_password_hash():
+@pytest.fixture
+def _cheap_bcrypt(monkeypatch):
+    """Минимально допустимая стоимость bcrypt (4 вместо 12): алгоритм тот же,
+    но в 256 раз меньше итераций key schedule"""
+    from src.conf.config import settings
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+
+
+@pytest.mark.real_bcrypt
+def test_get_password_hash(_cheap_bcrypt):
     """Тест создания хеша пароля"""
     password = "testpassword"
     hashed = get_password_hash(password)
@@ -21,7 +29,8 @@ def test_get_password_hash():
     assert hashed.startswith('$2')
 
 
-def test_verify_password():
+@pytest.mark.real_bcrypt
+def test_verify_password(_cheap_bcrypt):
     """Тест проверки пароля"""
     password = "testpassword"
     hashed = get_password_hash(password)
@@ -33,29 +42,29 @@ def test_verify_password():
     assert verify_password("wrongpassword", hashed) is False
 
 
-@pytest.mark.asyncio
-async def test_get_email_from_token_valid():
+def test_get_email_from_token_valid(monkeypatch):
     """Тест получения email из валидного токена"""
-    # Мокируем jwt.decode для возврата правильного payload
-    with patch("src.services.auth.jwt.decode") as mock_decode:
-        mock_decode.return_value = {"sub": "test@example.com"}
-        
-        # Вызываем функцию
-        email = await get_email_from_token("valid_token")
-        
-        # Проверяем результат
-        assert email == "test@example.com"
-        mock_decode.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_get_email_from_token_invalid():
+    # Подменяем jwt.decode обычной функцией — без стека unittest.mock._patch
+    monkeypatch.setattr(
+        "src.services.auth.jwt.decode", lambda *a, **k: {"sub": "test@example.com"}
+    )
+
+    # Вызываем функцию и проверяем результат
+    assert get_email_from_token("valid_token") == "test@example.com"
+
+
+def _raise_invalid_token(*args, **kwargs):
+    raise InvalidTokenError("JWT Error")
+
+
+def test_get_email_from_token_invalid(monkeypatch):
     """Тест получения email из невалидного токена"""
-    # Мокируем jwt.decode для генерации исключения JWTError
-    with patch("src.services.auth.jwt.decode", side_effect=JWTError("JWT Error")):
-        # Проверяем, что функция вызывает HTTPException
-        with pytest.raises(HTTPException) as excinfo:
-            await get_email_from_token("invalid_token")
-        
-        # Проверяем статус код исключения
-        assert excinfo.value.status_code == 422 
\ No newline at end of file
+    # Подменяем jwt.decode функцией, бросающей InvalidTokenError
+    monkeypatch.setattr("src.services.auth.jwt.decode", _raise_invalid_token)
+
+    # Проверяем, что функция вызывает HTTPException
+    with pytest.raises(HTTPException) as excinfo:
+        get_email_from_token("invalid_token")
+
+    # Проверяем статус код исключения
+    assert excinfo.value.status_code == 422
\ No newline at end of file
@@ -1,17 +1,9 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import date
+from unittest.mock import AsyncMock, MagicMock
 
 from fastapi import status, HTTPException
 
 from src.api.contacts import read_contacts, read_contact, create_contact, update_contact, delete_contact, search_contacts, upcoming_birthdays
-from src.schemas import ContactModel, ContactResponse, ContactUpdate
-
-
-@pytest.fixture
-def mock_user():
-    """Мок пользователя для тестов"""
-    return MagicMock(id=1, email="test@example.com")
 
 
 @pytest.fixture
@@ -29,190 +21,158 @@ def mock_contact_service():
 
 
 @pytest.fixture
-def mock_contact():
-    """Мок контакта для тестов"""
-    return MagicMock(
-        id=1,
-        name="John",
-        surname="Doe",
-        email="john@example.com",
-        phone="1234567890",
-        birthday=date(1990, 1, 1),
-        user_id=1
-    )
-
-
-@pytest.mark.asyncio
-async def test_read_contacts(mock_user, mock_contact_service):
+def patched_contact_service(monkeypatch, mock_contact_service):
+    """Подменяет ContactService через monkeypatch — один setattr вместо
+    контекстного менеджера patch в каждом тесте"""
+    monkeypatch.setattr("src.api.contacts.ContactService", lambda db: mock_contact_service)
+    return mock_contact_service
+
+
+async def test_read_contacts(mock_user, patched_contact_service):
     """Тест получения списка контактов"""
     # Настройка мока сервиса
     mock_contacts = [MagicMock(), MagicMock()]
-    mock_contact_service.get_contacts.return_value = mock_contacts
+    patched_contact_service.get_contacts.return_value = mock_contacts
     
     # Вызываем тестируемую функцию
-    with patch("src.api.contacts.ContactService", return_value=mock_contact_service):
-        result = await read_contacts(0, 100, None, mock_user)
+    result = await read_contacts(0, 100, None, mock_user)
     
     # Проверяем результат
     assert result == mock_contacts
-    mock_contact_service.get_contacts.assert_called_once_with(0, 100, mock_user.id)
+    patched_contact_service.get_contacts.assert_called_once_with(0, 100, mock_user.id)
 
 
-@pytest.mark.asyncio
-async def test_search_contacts(mock_user, mock_contact_service):
+async def test_search_contacts(mock_user, patched_contact_service):
     """Тест поиска контактов"""
     # Настройка мока сервиса
     mock_contacts = [MagicMock(), MagicMock()]
-    mock_contact_service.search_contacts.return_value = mock_contacts
+    patched_contact_service.search_contacts.return_value = mock_contacts
     
     # Вызываем тестируемую функцию
-    with patch("src.api.contacts.ContactService", return_value=mock_contact_service):
-        result = await search_contacts("John", None, mock_user)
+    result = await search_contacts("John", None, mock_user)
     
     # Проверяем результат
     assert result == mock_contacts
-    mock_contact_service.search_contacts.assert_called_once_with("John", mock_user.id)
+    patched_contact_service.search_contacts.assert_called_once_with("John", mock_user.id)
 
 
-@pytest.mark.asyncio
-async def test_upcoming_birthdays(mock_user, mock_contact_service):
+async def test_upcoming_birthdays(mock_user, patched_contact_service):
     """Тест получения предстоящих дней рождения"""
     # Настройка мока сервиса
     mock_contacts = [MagicMock(), MagicMock()]
-    mock_contact_service.get_contacts_by_birthday.return_value = mock_contacts
+    patched_contact_service.get_contacts_by_birthday.return_value = mock_contacts
     
     # Вызываем тестируемую функцию
-    with patch("src.api.contacts.ContactService", return_value=mock_contact_service):
-        result = await upcoming_birthdays(7, None, mock_user)
+    result = await upcoming_birthdays(7, None, mock_user)
     
     # Проверяем результат
     assert result == mock_contacts
-    mock_contact_service.get_contacts_by_birthday.assert_called_once_with(7, mock_user.id)
+    patched_contact_service.get_contacts_by_birthday.assert_called_once_with(7, mock_user.id)
 
 
-@pytest.mark.asyncio
-async def test_read_contact_found(mock_user, mock_contact_service, mock_contact):
+async def test_read_contact_found(mock_user, patched_contact_service, mock_contact):
     """Тест получения контакта по ID, когда контакт существует"""
     # Настройка мока сервиса
-    mock_contact_service.get_contact.return_value = mock_contact
+    patched_contact_service.get_contact.return_value = mock_contact
     
     # Вызываем тестируемую функцию
-    with patch("src.api.contacts.ContactService", return_value=mock_contact_service):
-        result = await read_contact(1, None, mock_user)
+    result = await read_contact(1, None, mock_user)
     
     # Проверяем результат
     assert result == mock_contact
-    mock_contact_service.get_contact.assert_called_once_with(1, mock_user.id)
+    patched_contact_service.get_contact.assert_called_once_with(1, mock_user.id)
 
 
-@pytest.mark.asyncio
-async def test_read_contact_not_found(mock_user, mock_contact_service):
+async def test_read_contact_not_found(mock_user, patched_contact_service):
     """Тест получения несуществующего контакта по ID"""
     # Настройка мока сервиса
-    mock_contact_service.get_contact.return_value = None
+    patched_contact_service.get_contact.return_value = None
     
     # Вызываем тестируемую функцию и ожидаем исключение
-    with patch("src.api.contacts.ContactService", return_value=mock_contact_service):
-        with pytest.raises(HTTPException) as exc_info:
-            await read_contact(999, None, mock_user)
+    with pytest.raises(HTTPException) as exc_info:
+        await read_contact(999, None, mock_user)
     
     # Проверяем исключение
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
     assert "Contact not found" in exc_info.value.detail
 
 
-@pytest.mark.asyncio
-async def test_create_contact(mock_user, mock_contact_service, mock_contact):
+async def test_create_contact(contact_model_body, mock_user, patched_contact_service, mock_contact):
     """Тест создания нового контакта"""
     # Настройка мока сервиса
-    mock_contact_service.create_contact.return_value = mock_contact
+    patched_contact_service.create_contact.return_value = mock_contact
     
-    # Создаем данные для контакта
-    contact_data = ContactModel(
-        name="John",
-        surname="Doe",
-        email="john@example.com",
-        phone="1234567890",
-        birthday=date(1990, 1, 1)
-    )
+    # Данные для контакта валидируются один раз на модуль
+    contact_data = contact_model_body
     
     # Вызываем тестируемую функцию
-    with patch("src.api.contacts.ContactService", return_value=mock_contact_service):
-        result = await create_contact(contact_data, None, mock_user)
+    result = await create_contact(contact_data, None, mock_user)
     
     # Проверяем результат
     assert result == mock_contact
-    mock_contact_service.create_contact.assert_called_once_with(contact_data, mock_user.id)
+    # Сравнение по identity, чтобы не гонять pydantic __eq__ по всем полям
+    patched_contact_service.create_contact.assert_called_once()
+    args = patched_contact_service.create_contact.call_args.args
+    assert args[0] is contact_data and args[1] == mock_user.id
 
 
-@pytest.mark.asyncio
-async def test_update_contact_found(mock_user, mock_contact_service, mock_contact):
+async def test_update_contact_found(contact_update_body, mock_user, patched_contact_service, mock_contact):
     """Тест обновления существующего контакта"""
     # Настройка мока сервиса
-    mock_contact_service.update_contact.return_value = mock_contact
+    patched_contact_service.update_contact.return_value = mock_contact
     
-    # Создаем данные для обновления
-    update_data = ContactUpdate(
-        name="John Updated",
-        surname="Doe Updated"
-    )
+    # Данные для обновления валидируются один раз на модуль
+    update_data = contact_update_body
     
     # Вызываем тестируемую функцию
-    with patch("src.api.contacts.ContactService", return_value=mock_contact_service):
-        result = await update_contact(update_data, 1, None, mock_user)
+    result = await update_contact(update_data, 1, None, mock_user)
     
     # Проверяем результат
     assert result == mock_contact
-    mock_contact_service.update_contact.assert_called_once_with(1, update_data, mock_user.id)
+    # Сравнение по identity, чтобы не гонять pydantic __eq__ по всем полям
+    patched_contact_service.update_contact.assert_called_once()
+    args = patched_contact_service.update_contact.call_args.args
+    assert args[0] == 1 and args[1] is update_data and args[2] == mock_user.id
 
 
-@pytest.mark.asyncio
-async def test_update_contact_not_found(mock_user, mock_contact_service):
+async def test_update_contact_not_found(contact_update_body, mock_user, patched_contact_service):
     """Тест обновления несуществующего контакта"""
     # Настройка мока сервиса
-    mock_contact_service.update_contact.return_value = None
+    patched_contact_service.update_contact.return_value = None
     
-    # Создаем данные для обновления
-    update_data = ContactUpdate(
-        name="John Updated",
-        surname="Doe Updated"
-    )
+    # Данные для обновления валидируются один раз на модуль
+    update_data = contact_update_body
     
     # Вызываем тестируемую функцию и ожидаем исключение
-    with patch("src.api.contacts.ContactService", return_value=mock_contact_service):
-        with pytest.raises(HTTPException) as exc_info:
-            await update_contact(update_data, 999, None, mock_user)
+    with pytest.raises(HTTPException) as exc_info:
+        await update_contact(update_data, 999, None, mock_user)
     
     # Проверяем исключение
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
     assert "Contact not found" in exc_info.value.detail
 
 
-@pytest.mark.asyncio
-async def test_delete_contact_found(mock_user, mock_contact_service, mock_contact):
+async def test_delete_contact_found(mock_user, patched_contact_service, mock_contact):
     """Тест удаления существующего контакта"""
     # Настройка мока сервиса
-    mock_contact_service.delete_contact.return_value = mock_contact
+    patched_contact_service.delete_contact.return_value = mock_contact
     
     # Вызываем тестируемую функцию
-    with patch("src.api.contacts.ContactService", return_value=mock_contact_service):
-        result = await delete_contact(1, None, mock_user)
+    result = await delete_contact(1, None, mock_user)
     
     # Проверяем результат
     assert result == mock_contact
-    mock_contact_service.delete_contact.assert_called_once_with(1, mock_user.id)
+    patched_contact_service.delete_contact.assert_called_once_with(1, mock_user.id)
 
 
-@pytest.mark.asyncio
-async def test_delete_contact_not_found(mock_user, mock_contact_service):
+async def test_delete_contact_not_found(mock_user, patched_contact_service):
     """Тест удаления несуществующего контакта"""
     # Настройка мока сервиса
-    mock_contact_service.delete_contact.return_value = None
+    patched_contact_service.delete_contact.return_value = None
     
     # Вызываем тестируемую функцию и ожидаем исключение
-    with patch("src.api.contacts.ContactService", return_value=mock_contact_service):
-        with pytest.raises(HTTPException) as exc_info:
-            await delete_contact(999, None, mock_user)
+    with pytest.raises(HTTPException) as exc_info:
+        await delete_contact(999, None, mock_user)
     
     # Проверяем исключение
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
@@ -1,51 +1,75 @@
 import pytest
 from datetime import date, timedelta
-from unittest.mock import MagicMock
+from types import MappingProxyType
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, insert, select
 
-from src.database.models import Contact, User
+from src.database.models import Contact
 from src.repository.contacts import ContactRepository
+from tests._helpers import persist
 from src.schemas import ContactModel, ContactUpdate
 
-@pytest.mark.asyncio
+# Shared seed data, built once at import: tests copy with
+# dict(base, user_id=...) instead of rebuilding the literals per call.
+# MappingProxyType keeps the templates read-only.
+# Prepared once at import: execute() takes the parameter dict, so the
+# Core statement object is never rebuilt per test
+CONTACTS_BY_USER = select(Contact).where(Contact.user_id == bindparam("user_id"))
+
+CONTACTS_BASIC = tuple(MappingProxyType(d) for d in (
+    {
+        "name": "John",
+        "surname": "Doe",
+        "email": "john@example.com",
+        "phone": "1234567890",
+        "birthday": date(1990, 1, 1),
+    },
+    {
+        "name": "Jane",
+        "surname": "Smith",
+        "email": "jane@example.com",
+        "phone": "0987654321",
+        "birthday": date(1992, 5, 20),
+    },
+))
+
+CONTACTS_SEARCH = tuple(MappingProxyType(d) for d in (
+    {
+        "name": "Robert",
+        "surname": "Smith",
+        "email": "robert@example.com",
+        "phone": "1112223333",
+        "birthday": date(1980, 5, 15),
+    },
+    {
+        "name": "Maria",
+        "surname": "Rodriguez",
+        "email": "maria@example.com",
+        "phone": "4445556666",
+        "birthday": date(1992, 8, 20),
+    },
+    {
+        "name": "Steve",
+        "surname": "Robertson",
+        "email": "steve@example.com",
+        "phone": "7778889999",
+        "birthday": date(1975, 3, 10),
+    },
+))
+
 class TestContactRepository:
-    async def test_get_contacts(self, async_session):
+    @pytest.fixture
+    def contact_repo(self, async_session):
+        """Repository bound to the per-test session, built once per test"""
+        return ContactRepository(async_session)
+
+    async def test_get_contacts(self, async_session, contact_repo, test_user_id):
         # Arrange
-        contact_repo = ContactRepository(async_session)
-        
-        # Create a test user
-        user = User(username="test_user", email="test@example.com", hashed_password="password")
-        async_session.add(user)
-        await async_session.commit()
-        await async_session.refresh(user)
-        
-        user_id = user.id
-        
-        # Create test contacts
-        contacts_data = [
-            {
-                "name": "John", 
-                "surname": "Doe", 
-                "email": "john@example.com", 
-                "phone": "1234567890", 
-                "birthday": date(1990, 1, 1), 
-                "user_id": user_id
-            },
-            {
-                "name": "Jane", 
-                "surname": "Smith", 
-                "email": "jane@example.com", 
-                "phone": "0987654321", 
-                "birthday": date(1992, 5, 20), 
-                "user_id": user_id
-            }
-        ]
+        user_id = test_user_id
         
-        for contact_data in contacts_data:
-            async_session.add(Contact(**contact_data))
-        await async_session.commit()
+        # Core bulk insert: one multi-row statement, no ORM instrumentation
+        contacts_data = [dict(base, user_id=user_id) for base in CONTACTS_BASIC]
+        await async_session.execute(insert(Contact), contacts_data)
         
         # Act
         contacts = await contact_repo.get_contacts(skip=0, limit=10, user_id=user_id)
@@ -55,17 +79,9 @@ class TestContactRepository:
         assert contacts[0].name == "John"
         assert contacts[1].name == "Jane"
     
-    async def test_get_contact_by_id(self, async_session):
+    async def test_get_contact_by_id(self, async_session, contact_repo, test_user_id):
         # Arrange
-        contact_repo = ContactRepository(async_session)
-        
-        # Create a test user
-        user = User(username="test_user2", email="test2@example.com", hashed_password="password")
-        async_session.add(user)
-        await async_session.commit()
-        await async_session.refresh(user)
-        
-        user_id = user.id
+        user_id = test_user_id
         
         # Create a test contact
         contact_data = {
@@ -77,46 +93,27 @@ class TestContactRepository:
             "user_id": user_id
         }
         
-        contact = Contact(**contact_data)
-        async_session.add(contact)
-        await async_session.commit()
-        await async_session.refresh(contact)
+        contact = await persist(async_session, Contact(**contact_data))
+        contact_id = contact.id
         
         # Act
-        result = await contact_repo.get_contact_by_id(contact.id, user_id)
+        result = await contact_repo.get_contact_by_id(contact_id, user_id)
         
         # Assert
         assert result is not None
         assert result.name == contact_data["name"]
         assert result.email == contact_data["email"]
     
-    async def test_get_nonexistent_contact(self, async_session):
-        # Arrange
-        contact_repo = ContactRepository(async_session)
-        
-        # Create a test user
-        user = User(username="test_user3", email="test3@example.com", hashed_password="password")
-        async_session.add(user)
-        await async_session.commit()
-        await async_session.refresh(user)
-        
+    async def test_get_nonexistent_contact(self, async_session, contact_repo, test_user_id):
         # Act
-        result = await contact_repo.get_contact_by_id(999, user.id)
+        result = await contact_repo.get_contact_by_id(999, test_user_id)
         
         # Assert
         assert result is None
     
-    async def test_get_contacts_by_birthday(self, async_session):
+    async def test_get_contacts_by_birthday(self, async_session, contact_repo, test_user_id):
         # Arrange
-        contact_repo = ContactRepository(async_session)
-        
-        # Create a test user
-        user = User(username="test_user4", email="test4@example.com", hashed_password="password")
-        async_session.add(user)
-        await async_session.commit()
-        await async_session.refresh(user)
-        
-        user_id = user.id
+        user_id = test_user_id
         
         # Today and upcoming dates for testing
         today = date.today()
@@ -124,14 +121,10 @@ class TestContactRepository:
         next_week = today + timedelta(days=7)
         month_later = today + timedelta(days=30)
         
-        # Create birthday adjusted to current year
+        # Birthday in 1990 on the target month/day; the old year-rollover
+        # branch was dead code since the return always used 1990
         def birthday_for(target_date):
-            target_month = target_date.month
-            target_day = target_date.day
-            year = date.today().year
-            if date.today() > date(year, target_month, target_day):
-                year += 1
-            return date(1990, target_month, target_day)  # Using 1990 as birth year
+            return date(1990, target_date.month, target_date.day)
         
         # Create test contacts with specific birthdays
         contacts_data = [
@@ -169,74 +162,32 @@ class TestContactRepository:
             }
         ]
         
-        for contact_data in contacts_data:
-            async_session.add(Contact(**contact_data))
-        await async_session.commit()
+        # Core bulk insert: one multi-row statement, no ORM instrumentation
+        await async_session.execute(insert(Contact), contacts_data)
         
         # Act - Get contacts with birthdays in the next 7 days
         upcoming_contacts = await contact_repo.get_contacts_by_birthday(days=7, user_id=user_id)
         
-        # Assert
-        # We should get 3 contacts (today, tomorrow, and one week from now)
-        contact_emails = [contact.email for contact in upcoming_contacts]
-        assert len(upcoming_contacts) == 3
-        assert "today@example.com" in contact_emails
-        assert "tomorrow@example.com" in contact_emails
-        assert "nextweek@example.com" in contact_emails
-        assert "later@example.com" not in contact_emails
+        # Assert - set equality also catches unexpected extra rows
+        assert {contact.email for contact in upcoming_contacts} == {
+            "today@example.com",
+            "tomorrow@example.com",
+            "nextweek@example.com",
+        }
     
-    async def test_search_contacts(self, async_session):
+    async def test_search_contacts(self, async_session, contact_repo, test_user_id):
         # Arrange
-        contact_repo = ContactRepository(async_session)
-        
-        # Create a test user
-        user = User(username="test_user5", email="test5@example.com", hashed_password="password")
-        async_session.add(user)
-        await async_session.commit()
-        await async_session.refresh(user)
-        
-        user_id = user.id
-        
-        # Create test contacts for search
-        contacts_data = [
-            {
-                "name": "Robert", 
-                "surname": "Smith", 
-                "email": "robert@example.com", 
-                "phone": "1112223333", 
-                "birthday": date(1980, 5, 15), 
-                "user_id": user_id
-            },
-            {
-                "name": "Maria", 
-                "surname": "Rodriguez", 
-                "email": "maria@example.com", 
-                "phone": "4445556666", 
-                "birthday": date(1992, 8, 20), 
-                "user_id": user_id
-            },
-            {
-                "name": "Steve", 
-                "surname": "Robertson", 
-                "email": "steve@example.com", 
-                "phone": "7778889999", 
-                "birthday": date(1975, 3, 10), 
-                "user_id": user_id
-            }
-        ]
+        user_id = test_user_id
         
-        for contact_data in contacts_data:
-            async_session.add(Contact(**contact_data))
-        await async_session.commit()
+        # Core bulk insert: one multi-row statement, no ORM instrumentation
+        contacts_data = [dict(base, user_id=user_id) for base in CONTACTS_SEARCH]
+        await async_session.execute(insert(Contact), contacts_data)
         
         # Act - Search by name
         name_results = await contact_repo.search_contacts("Rob", user_id)
         
-        # Assert
-        assert len(name_results) == 2  # Should match Robert and Robertson
-        name_result_names = {contact.name for contact in name_results}
-        assert "Robert" in name_result_names
-        assert "Steve" in name_result_names
+        # Assert - should match Robert and Robertson, and nothing else
+        assert {contact.name for contact in name_results} == {"Robert", "Steve"}
         
         # Act - Search by email
         email_results = await contact_repo.search_contacts("maria", user_id)
@@ -245,20 +196,13 @@ class TestContactRepository:
         assert len(email_results) == 1
         assert email_results[0].name == "Maria"
     
-    async def test_create_contact(self, async_session):
+    async def test_create_contact(self, async_session, contact_repo, test_user_id):
         # Arrange
-        contact_repo = ContactRepository(async_session)
-        
-        # Create a test user
-        user = User(username="test_user6", email="test6@example.com", hashed_password="password")
-        async_session.add(user)
-        await async_session.commit()
-        await async_session.refresh(user)
-        
-        user_id = user.id
+        user_id = test_user_id
         
         # Create contact data
-        contact_data = ContactModel(
+        # model_construct skips validation for known-good literal data
+        contact_data = ContactModel.model_construct(
             name="New",
             surname="Contact",
             email="new@example.com",
@@ -277,24 +221,50 @@ class TestContactRepository:
         assert contact.birthday == contact_data.birthday
         assert contact.user_id == user_id
         
-        # Verify the contact was created in the database
-        stmt = select(Contact).filter_by(email=contact_data.email)
-        result = await async_session.execute(stmt)
-        db_contact = result.scalar_one_or_none()
+        # Verify the contact was created: get() by PK hits the identity
+        # map before issuing any SQL
+        db_contact = await async_session.get(Contact, contact.id)
         assert db_contact is not None
         assert db_contact.name == contact_data.name
     
-    async def test_update_contact(self, async_session):
+    async def test_create_contacts_bulk(self, async_session, contact_repo, test_user_id):
         # Arrange
-        contact_repo = ContactRepository(async_session)
-        
-        # Create a test user
-        user = User(username="test_user7", email="test7@example.com", hashed_password="password")
-        async_session.add(user)
-        await async_session.commit()
-        await async_session.refresh(user)
-        
-        user_id = user.id
+        user_id = test_user_id
+
+        # Create contact data
+        contacts_data = [
+            ContactModel(
+                name="Bulk1",
+                surname="Contact",
+                email="bulk1@example.com",
+                phone="1010101010",
+                birthday=date(1991, 1, 1)
+            ),
+            ContactModel(
+                name="Bulk2",
+                surname="Contact",
+                email="bulk2@example.com",
+                phone="2020202020",
+                birthday=date(1992, 2, 2)
+            )
+        ]
+
+        # Act
+        contacts = await contact_repo.create_contacts_bulk(contacts_data, user_id)
+
+        # Assert
+        assert len(contacts) == 2
+        assert all(contact.id is not None for contact in contacts)
+        assert all(contact.user_id == user_id for contact in contacts)
+
+        # Verify the contacts were created in the database
+        result = await async_session.execute(CONTACTS_BY_USER, {"user_id": user_id})
+        db_contacts = result.scalars().all()
+        assert len(db_contacts) == 2
+
+    async def test_update_contact(self, async_session, contact_repo, test_user_id):
+        # Arrange
+        user_id = test_user_id
         
         # Create a test contact
         contact_data = {
@@ -306,20 +276,19 @@ class TestContactRepository:
             "user_id": user_id
         }
         
-        contact = Contact(**contact_data)
-        async_session.add(contact)
-        await async_session.commit()
-        await async_session.refresh(contact)
+        contact = await persist(async_session, Contact(**contact_data))
+        contact_id = contact.id
         
         # Update data
-        update_data = ContactUpdate(
+        # model_construct skips validation for known-good literal data
+        update_data = ContactUpdate.model_construct(
             name="Updated",
             surname="Name",
             additional_data="Some additional information"
         )
         
         # Act
-        updated_contact = await contact_repo.update_contact(contact.id, update_data, user_id)
+        updated_contact = await contact_repo.update_contact(contact_id, update_data, user_id)
         
         # Assert
         assert updated_contact is not None
@@ -328,17 +297,9 @@ class TestContactRepository:
         assert updated_contact.email == contact_data["email"]  # Unchanged
         assert updated_contact.additional_data == "Some additional information"
     
-    async def test_delete_contact(self, async_session):
+    async def test_delete_contact(self, async_session, contact_repo, test_user_id):
         # Arrange
-        contact_repo = ContactRepository(async_session)
-        
-        # Create a test user
-        user = User(username="test_user8", email="test8@example.com", hashed_password="password")
-        async_session.add(user)
-        await async_session.commit()
-        await async_session.refresh(user)
-        
-        user_id = user.id
+        user_id = test_user_id
         
         # Create a test contact
         contact_data = {
@@ -350,11 +311,7 @@ class TestContactRepository:
             "user_id": user_id
         }
         
-        contact = Contact(**contact_data)
-        async_session.add(contact)
-        await async_session.commit()
-        await async_session.refresh(contact)
-        
+        contact = await persist(async_session, Contact(**contact_data))
         contact_id = contact.id
         
         # Act
@@ -365,7 +322,5 @@ class TestContactRepository:
         assert deleted_contact.name == contact_data["name"]
         
         # Verify the contact was deleted from the database
-        stmt = select(Contact).filter_by(id=contact_id)
-        result = await async_session.execute(stmt)
-        db_contact = result.scalar_one_or_none()
+        db_contact = await async_session.get(Contact, contact_id)
         assert db_contact is None 
\ No newline at end of file
@@ -3,10 +3,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import contextlib
 from sqlalchemy.exc import SQLAlchemyError
 
+from src.conf.config import settings
 from src.database.db import get_db, DatabaseSessionManager
 
 
-@pytest.mark.asyncio
 async def test_get_db():
     """Тест функции get_db"""
     # Создаем мок для сессии
@@ -43,7 +43,6 @@ async def test_get_db():
         mock_context_manager.__aenter__.assert_called_once()
         
 
-@pytest.mark.asyncio
 async def test_database_session_manager_init():
     """Тест инициализации менеджера сессии базы данных"""
     # Создаем моки для engine и session_maker
@@ -59,7 +58,15 @@ async def test_database_session_manager_init():
         db_manager = DatabaseSessionManager("sqlite:///test.db")
         
         # Проверяем, что функции были вызваны с правильными параметрами
-        mock_create_engine.assert_called_once_with("sqlite:///test.db")
+        mock_create_engine.assert_called_once_with(
+            "sqlite:///test.db",
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+            query_cache_size=1200,
+        )
         mock_async_sessionmaker.assert_called_once_with(
             autoflush=False, autocommit=False, bind=mock_engine
         )
@@ -69,7 +76,6 @@ async def test_database_session_manager_init():
         assert db_manager._session_maker == mock_session_maker
 
 
-@pytest.mark.asyncio
 async def test_database_session_manager_session():
     """Тест метода session в DatabaseSessionManager"""
     # Создаем моки для session и session_maker
@@ -111,7 +117,6 @@ async def test_database_session_manager_session():
     mock_session.close.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_database_session_manager_not_initialized():
     """Тест вызова session с неинициализированным session_maker"""
     # Создаем экземпляр класса без session_maker
@@ -6,7 +6,6 @@ from fastapi_mail.errors import ConnectionErrors
 from src.services.email import send_email
 
 
-@pytest.mark.asyncio
 async def test_send_email_success():
     """Тест успешной отправки email"""
     # Создаем моки для модулей
@@ -20,11 +19,17 @@ async def test_send_email_success():
     username = "testuser"
     host = "localhost:8000"
     
-    # Патчим необходимые функции и классы
-    with (
-        patch("src.services.email.MessageSchema", return_value=mock_message) as mock_message_schema,
-        patch("src.services.email.FastMail", return_value=mock_fast_mail) as mock_fastmail_class,
-        patch("src.services.email.create_email_token", AsyncMock(return_value=mock_token)) as mock_create_token
+    mock_message_schema = MagicMock(return_value=mock_message)
+    mock_fastmail_class = MagicMock(return_value=mock_fast_mail)
+    mock_create_token = MagicMock(return_value=mock_token)
+
+    # Один patch.multiple вместо трёх отдельных patch: один enter/exit
+    # цикл и одна точка отката
+    with patch.multiple(
+        "src.services.email",
+        MessageSchema=mock_message_schema,
+        FastMail=mock_fastmail_class,
+        create_email_token=mock_create_token,
     ):
         # Вызываем тестируемую функцию
         await send_email(email_to, username, host)
@@ -49,7 +54,6 @@ async def test_send_email_success():
         mock_fast_mail.send_message.assert_called_once_with(mock_message, template_name="verify_email.html")
 
 
-@pytest.mark.asyncio
 async def test_send_email_connection_error():
     """Тест обработки ошибки при отправке email"""
     # Создаем моки для модулей
@@ -64,11 +68,14 @@ async def test_send_email_connection_error():
     username = "testuser"
     host = "localhost:8000"
     
-    # Патчим необходимые функции, классы и print
+    # Патчим модуль одним patch.multiple, print — отдельно (другой таргет)
     with (
-        patch("src.services.email.MessageSchema", return_value=mock_message),
-        patch("src.services.email.FastMail", return_value=mock_fast_mail),
-        patch("src.services.email.create_email_token", AsyncMock(return_value=mock_token)),
+        patch.multiple(
+            "src.services.email",
+            MessageSchema=MagicMock(return_value=mock_message),
+            FastMail=MagicMock(return_value=mock_fast_mail),
+            create_email_token=MagicMock(return_value=mock_token),
+        ),
         patch("builtins.print") as mock_print
     ):
         # Вызываем тестируемую функцию
@@ -1,21 +1,26 @@
 import pytest
-import time
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi import Request, HTTPException, status
+from fastapi import HTTPException, status
 
 from src.services.rate_limiter import RateLimiter
 
 
 @pytest.fixture
 def mock_redis():
-    """Мок Redis для тестов"""
+    """Мок Redis для тестов: лимитер ходит в Redis одним EVALSHA"""
     redis = MagicMock()
-    redis.get = AsyncMock(return_value=None)
-    redis.set = AsyncMock()
-    redis.incr = AsyncMock(return_value=1)
+    redis.script_load = AsyncMock(return_value="sha1")
+    redis.evalsha = AsyncMock(return_value=1)
     return redis
 
 
+def make_request(host="127.0.0.1", path="/api/test"):
+    """Лёгкий стаб Request: лимитеру нужны только client.host и url.path,
+    спека по fastapi.Request обходила бы весь класс при каждом тесте"""
+    return SimpleNamespace(client=SimpleNamespace(host=host), url=SimpleNamespace(path=path))
+
+
 def test_rate_limiter_init():
     """Тест инициализации RateLimiter"""
     limiter = RateLimiter(times=10, seconds=60)
@@ -24,15 +29,12 @@ def test_rate_limiter_init():
     assert limiter.requests == {}
 
 
-@pytest.mark.asyncio
 async def test_rate_limiter_first_request():
     """Тест первого запроса к rate limiter"""
     limiter = RateLimiter(times=10, seconds=60)
     
     # Создаем мок запроса
-    request = MagicMock(spec=Request)
-    request.client.host = "127.0.0.1"
-    request.url.path = "/api/test"
+    request = make_request("127.0.0.1", "/api/test")
     
     # Вызываем метод
     result = await limiter(request)
@@ -42,15 +44,12 @@ async def test_rate_limiter_first_request():
     assert len(limiter.requests["127.0.0.1:/api/test"]) == 1
 
 
-@pytest.mark.asyncio
 async def test_rate_limiter_multiple_requests():
     """Тест множественных запросов, но в пределах ограничения"""
     limiter = RateLimiter(times=10, seconds=60)
     
     # Создаем мок запроса
-    request = MagicMock(spec=Request)
-    request.client.host = "127.0.0.1"
-    request.url.path = "/api/test"
+    request = make_request("127.0.0.1", "/api/test")
     
     # Делаем несколько запросов
     for _ in range(5):
@@ -61,15 +60,12 @@ async def test_rate_limiter_multiple_requests():
     assert len(limiter.requests["127.0.0.1:/api/test"]) == 5
 
 
-@pytest.mark.asyncio
 async def test_rate_limiter_endpoint_parameter():
     """Тест с указанным endpoint параметром"""
     limiter = RateLimiter(times=10, seconds=60)
     
     # Создаем мок запроса
-    request = MagicMock(spec=Request)
-    request.client.host = "127.0.0.1"
-    request.url.path = "/api/original"
+    request = make_request("127.0.0.1", "/api/original")
     
     # Вызываем с указанным endpoint
     result = await limiter(request, endpoint="/api/custom")
@@ -80,15 +76,12 @@ async def test_rate_limiter_endpoint_parameter():
     assert "127.0.0.1:/api/original" not in limiter.requests
 
 
-@pytest.mark.asyncio
 async def test_rate_limiter_limit_exceeded():
     """Тест превышения ограничения запросов"""
     limiter = RateLimiter(times=3, seconds=60)
     
     # Создаем мок запроса
-    request = MagicMock(spec=Request)
-    request.client.host = "127.0.0.1"
-    request.url.path = "/api/test"
+    request = make_request("127.0.0.1", "/api/test")
     
     # Делаем запросы до предела
     for _ in range(3):
@@ -104,19 +97,14 @@ async def test_rate_limiter_limit_exceeded():
     assert "Слишком много запросов" in exc_info.value.detail
 
 
-@pytest.mark.asyncio
 async def test_rate_limiter_separate_endpoints():
     """Тест ограничения для разных endpoint-ов"""
     limiter = RateLimiter(times=3, seconds=60)
     
     # Создаем моки запросов к разным endpoint-ам
-    request1 = MagicMock(spec=Request)
-    request1.client.host = "127.0.0.1"
-    request1.url.path = "/api/endpoint1"
+    request1 = make_request("127.0.0.1", "/api/endpoint1")
     
-    request2 = MagicMock(spec=Request)
-    request2.client.host = "127.0.0.1"
-    request2.url.path = "/api/endpoint2"
+    request2 = make_request("127.0.0.1", "/api/endpoint2")
     
     # Делаем запросы к разным endpoint-ам
     for _ in range(3):
@@ -134,19 +122,14 @@ async def test_rate_limiter_separate_endpoints():
         await limiter(request2)
 
 
-@pytest.mark.asyncio
 async def test_rate_limiter_separate_ips():
     """Тест ограничения для разных IP адресов"""
     limiter = RateLimiter(times=3, seconds=60)
     
     # Создаем моки запросов с разных IP
-    request1 = MagicMock(spec=Request)
-    request1.client.host = "127.0.0.1"
-    request1.url.path = "/api/test"
+    request1 = make_request("127.0.0.1", "/api/test")
     
-    request2 = MagicMock(spec=Request)
-    request2.client.host = "192.168.1.1"
-    request2.url.path = "/api/test"
+    request2 = make_request("192.168.1.1", "/api/test")
     
     # Делаем запросы с разных IP
     for _ in range(3):
@@ -164,28 +147,27 @@ async def test_rate_limiter_separate_ips():
         await limiter(request2)
 
 
-@pytest.mark.asyncio
 async def test_rate_limiter_expired_timestamps():
     """Тест очистки устаревших timestamp-ов"""
-    limiter = RateLimiter(times=3, seconds=1)  # 1 секунда для быстрых тестов
-    
+    # Подставные часы вместо time.sleep: окно двигаем вручную
+    clock = [0.0]
+    limiter = RateLimiter(times=3, seconds=1, time_func=lambda: clock[0])
+
     # Создаем мок запроса
-    request = MagicMock(spec=Request)
-    request.client.host = "127.0.0.1"
-    request.url.path = "/api/test"
-    
+    request = make_request("127.0.0.1", "/api/test")
+
     # Делаем 3 запроса
     for _ in range(3):
         result = await limiter(request)
         assert result is True
-    
-    # Подождем более 1 секунды
-    time.sleep(1.1)
-    
+
+    # Продвигаем часы за пределы окна
+    clock[0] = 2.0
+
     # Теперь лимит должен быть сброшен и запрос должен пройти
     result = await limiter(request)
     assert result is True
-    
+
     # Проверяем, что старые запросы были удалены
     assert len(limiter.requests["127.0.0.1:/api/test"]) == 1
 
@@ -196,18 +178,16 @@ async def test_rate_limit_first_request(mock_redis):
     limiter = RateLimiter(times=10, seconds=60)
     
     # Создаем запрос
-    request = MagicMock(spec=Request)
-    request.client.host = "127.0.0.1"
+    request = make_request()
     
     # Патчим Redis
     with patch("src.services.rate_limiter.redis_client", mock_redis):
         # Вызываем тестируемую функцию
         await limiter(request)
-        
-        # Проверяем, что Redis был использован
-        mock_redis.get.assert_called_once()
-        mock_redis.incr.assert_called_once()
-        mock_redis.set.assert_called_once()
+
+        # Один round-trip: скрипт загружен и вызван по sha
+        mock_redis.script_load.assert_called_once()
+        mock_redis.evalsha.assert_called_once()
 
 
 async def test_rate_limit_exceeded(mock_redis):
@@ -216,12 +196,10 @@ async def test_rate_limit_exceeded(mock_redis):
     limiter = RateLimiter(times=10, seconds=60)
     
     # Создаем запрос
-    request = MagicMock(spec=Request)
-    request.client.host = "127.0.0.1"
+    request = make_request()
     
     # Настраиваем Redis для возврата значения больше лимита
-    mock_redis.get.return_value = b"5"  # Уже есть 5 запросов
-    mock_redis.incr.return_value = 11  # 11-й запрос превышает лимит 10
+    mock_redis.evalsha.return_value = 11  # 11-й запрос превышает лимит 10
     
     # Патчим Redis
     with patch("src.services.rate_limiter.redis_client", mock_redis):
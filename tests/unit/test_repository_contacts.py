@@ -1,28 +1,46 @@
 import pytest
-from sqlalchemy import select
-from unittest.mock import MagicMock, AsyncMock, patch
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import Mock, MagicMock, AsyncMock
 from datetime import date, timedelta
 
 from src.database.models import Contact
 from src.repository.contacts import ContactRepository
-from src.schemas import ContactModel, ContactUpdate
 
 
-@pytest.mark.asyncio
 class TestContactRepository:
-    async def test_get_contacts(self):
-        # Создаем моки для объектов
-        mock_session = AsyncMock()
+    @pytest.fixture(scope="class")
+    def _session_proto(self):
+        """Мок-сессия, построенная один раз на класс; spec ограничивает
+        мок реальным API AsyncSession: опечатка в имени метода падает,
+        а не проглатывается"""
+        return AsyncMock(spec=AsyncSession)
+
+    @pytest.fixture
+    def mock_session(self, _session_proto):
+        """Представление прототипа на один тест: сброс вызовов и
+        return_value намного дешевле пересборки графа AsyncMock"""
+        _session_proto.reset_mock(return_value=True, side_effect=True)
+        return _session_proto
+
+    @pytest.fixture
+    def mock_result(self, mock_session):
+        """Результат execute, заранее подключённый к сессии; Mock вместо
+        MagicMock — магические методы здесь не нужны"""
+        result = Mock(spec=Result)
+        mock_session.execute.return_value = result
+        return result
+
+    @pytest.fixture
+    def repo(self, mock_session):
+        return ContactRepository(mock_session)
+
+    async def test_get_contacts(self, mock_session, mock_result, repo):
         mock_contacts = [Contact(id=1), Contact(id=2)]
         
         # Настраиваем возвращаемое значение для метода execute
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_contacts
-        mock_session.execute.return_value = mock_result
-        
-        # Создаем экземпляр репозитория
-        repo = ContactRepository(mock_session)
-        
+        mock_result.all.return_value = mock_contacts
+
         # Вызываем тестируемый метод
         result = await repo.get_contacts(0, 10, 1)
         
@@ -31,137 +49,93 @@ class TestContactRepository:
         # Проверяем, что метод execute был вызван
         mock_session.execute.assert_called_once()
     
-    async def test_get_contact_by_id(self):
-        # Создаем моки для объектов
-        mock_session = AsyncMock()
-        mock_contact = Contact(id=1)
-        
-        # Настраиваем возвращаемое значение для метода execute
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_contact
-        mock_session.execute.return_value = mock_result
-        
-        # Создаем экземпляр репозитория
-        repo = ContactRepository(mock_session)
-        
+    async def test_get_contact_by_id(self, mock_session, repo):
+        mock_contact = Contact(id=1, user_id=1)
+
+        # Настраиваем возвращаемое значение для метода get
+        mock_session.get.return_value = mock_contact
+
         # Вызываем тестируемый метод
         result = await repo.get_contact_by_id(1, 1)
-        
+
         # Проверяем результат
         assert result == mock_contact
-        # Проверяем, что метод execute был вызван
-        mock_session.execute.assert_called_once()
+        # Проверяем, что метод get был вызван
+        mock_session.get.assert_called_once_with(Contact, 1)
     
-    async def test_create_contact(self):
-        # Создаем моки для объектов
-        mock_session = AsyncMock()
+    async def test_create_contact(self, monkeypatch, mock_session, repo, contact_model_body):
         mock_contact = Contact(id=1)
         
-        # Патчим модель Contact
-        with patch('src.repository.contacts.Contact') as mock_contact_model:
-            mock_contact_model.return_value = mock_contact
-            
-            # Создаем экземпляр репозитория
-            repo = ContactRepository(mock_session)
-            
-            # Создаем данные контакта
-            contact_data = ContactModel(
-                name="Test",
-                surname="Contact",
-                email="test@example.com",
-                phone="1234567890",
-                birthday=date(1990, 1, 1)
-            )
-            
-            # Вызываем тестируемый метод
-            result = await repo.create_contact(contact_data, 1)
-            
-            # Проверяем результат
-            assert result == mock_contact
-            # Проверяем, что методы сессии были вызваны
-            mock_session.add.assert_called_once_with(mock_contact)
-            mock_session.commit.assert_called_once()
-            mock_session.refresh.assert_called_once_with(mock_contact)
-    
-    async def test_update_contact(self):
-        # Создаем моки для объектов
-        mock_session = AsyncMock()
-        mock_contact = Contact(id=1, name="Test")
-        
-        # Настраиваем возвращаемое значение для метода execute
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_contact
-        mock_session.execute.return_value = mock_result
-        
-        # Создаем экземпляр репозитория
-        repo = ContactRepository(mock_session)
-        
-        # Создаем данные для обновления
-        contact_update = ContactUpdate(name="Updated")
+        # Подменяем модель через monkeypatch: лямбда-фабрика легче, чем
+        # MagicMock в роли класса, а откат выполнит финализатор узла
+        monkeypatch.setattr(
+            "src.repository.contacts.Contact", lambda **kwargs: mock_contact
+        )
         
         # Вызываем тестируемый метод
-        result = await repo.update_contact(1, contact_update, 1)
+        result = await repo.create_contact(contact_model_body, 1)
         
+        # Проверяем результат
+        assert result == mock_contact
+        # Проверяем, что методы сессии были вызваны
+        mock_session.add.assert_called_once_with(mock_contact)
+        mock_session.flush.assert_called_once()
+        mock_session.commit.assert_called_once()
+        mock_session.refresh.assert_not_called()
+    
+    async def test_update_contact(self, mock_session, mock_result, repo, contact_update_body):
+        mock_contact = Contact(id=1, name="Updated", user_id=1)
+
+        # Настраиваем возвращаемое значение для UPDATE ... RETURNING
+        mock_result.scalar_one_or_none.return_value = mock_contact
+
+        # Вызываем тестируемый метод
+        result = await repo.update_contact(1, contact_update_body, 1)
+
         # Проверяем результат
         assert result.name == "Updated"
         # Проверяем, что методы сессии были вызваны
+        mock_session.execute.assert_called_once()
         mock_session.commit.assert_called_once()
     
-    async def test_delete_contact(self):
-        # Создаем моки для объектов
-        mock_session = AsyncMock()
-        mock_contact = Contact(id=1)
-        
-        # Настраиваем возвращаемое значение для метода execute
-        mock_result = MagicMock()
+    async def test_delete_contact(self, mock_session, mock_result, repo):
+        mock_contact = Contact(id=1, user_id=1)
+
+        # Настраиваем возвращаемое значение для DELETE ... RETURNING
         mock_result.scalar_one_or_none.return_value = mock_contact
-        mock_session.execute.return_value = mock_result
-        
-        # Создаем экземпляр репозитория
-        repo = ContactRepository(mock_session)
-        
+
         # Вызываем тестируемый метод
         result = await repo.delete_contact(1, 1)
-        
+
         # Проверяем результат
         assert result == mock_contact
         # Проверяем, что методы сессии были вызваны
-        mock_session.delete.assert_called_once_with(mock_contact)
+        mock_session.execute.assert_called_once()
         mock_session.commit.assert_called_once()
     
-    async def test_search_contacts(self):
-        # Создаем моки для объектов
-        mock_session = AsyncMock()
+    async def test_search_contacts(self, mock_session, repo):
         mock_contacts = [Contact(id=1), Contact(id=2)]
-        
-        # Настраиваем возвращаемое значение для метода execute
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_contacts
-        mock_session.execute.return_value = mock_result
-        
-        # Создаем экземпляр репозитория
-        repo = ContactRepository(mock_session)
-        
+
+        # Настраиваем возвращаемое значение для метода stream
+        async def stream_result():
+            for contact in mock_contacts:
+                yield contact
+
+        mock_session.stream.return_value = stream_result()
+
         # Вызываем тестируемый метод
         result = await repo.search_contacts("test", 1)
-        
+
         # Проверяем результат
         assert result == mock_contacts
-        # Проверяем, что метод execute был вызван
-        mock_session.execute.assert_called_once()
+        # Проверяем, что метод stream был вызван
+        mock_session.stream.assert_called_once()
     
-    async def test_get_contacts_by_birthday(self):
-        # Создаем моки для объектов
-        mock_session = AsyncMock()
+    async def test_get_contacts_by_birthday(self, mock_session, mock_result, repo):
         mock_contacts = [Contact(id=1, birthday=date.today()), Contact(id=2, birthday=date.today() + timedelta(days=1))]
         
         # Настраиваем возвращаемое значение для метода execute
-        mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = mock_contacts
-        mock_session.execute.return_value = mock_result
-        
-        # Создаем экземпляр репозитория
-        repo = ContactRepository(mock_session)
         
         # Вызываем тестируемый метод
         result = await repo.get_contacts_by_birthday(7, 1)
@@ -1,142 +1,120 @@
 import pytest
-from sqlalchemy import select
-from unittest.mock import MagicMock, AsyncMock, patch
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import Mock, AsyncMock
 
 from src.database.models import User
 from src.repository.users import UserRepository
-from src.schemas import UserCreate
-
-
-@pytest.mark.asyncio
-class TestUserRepository:
-    async def test_get_users(self):
-        # Create mocks for objects
-        mock_session = AsyncMock()
-        mock_users = [User(id=1), User(id=2)]
-        
-        # Set up return value for execute method
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_users
-        mock_session.execute.return_value = mock_result
-        
-        # Create repository instance
-        repo = UserRepository(mock_session)
-        
-        # Call the tested method
-        result = await repo.get_users()
-        
-        # Check the result
-        assert result == mock_users
-        # Check that execute method was called
-        mock_session.execute.assert_called_once()
+
+
+@pytest.fixture(scope="module")
+def _session_proto():
+    """Spec'd AsyncMock built once per module; spec pins the mock to
+    the real AsyncSession API so misspelled methods fail instead of
+    passing, and construction cost is paid once"""
+    return AsyncMock(spec=AsyncSession)
+
+@pytest.fixture
+def mock_session(_session_proto):
+    """Per-test view of the prototype: resetting calls and return
+    values is far cheaper than rebuilding the AsyncMock graph"""
+    _session_proto.reset_mock(return_value=True, side_effect=True)
+    return _session_proto
+
+@pytest.fixture
+def mock_result(mock_session):
+    """Execute result pre-wired into the session; plain Mock since
+    no magic methods are needed on a Result"""
+    result = Mock(spec=Result)
+    mock_session.execute.return_value = result
+    return result
+
+@pytest.fixture
+def repo(mock_session):
+    return UserRepository(mock_session)
+
+async def test_get_users(mock_session, mock_result, repo):
+    mock_users = [User(id=1), User(id=2)]
+    
+    # Set up return value for execute method
+    mock_result.scalars.return_value.all.return_value = mock_users
+    
+    # Call the tested method
+    result = await repo.get_users()
+    
+    # Check the result
+    assert result == mock_users
+    # Check that execute method was called
+    mock_session.execute.assert_called_once()
+
+async def test_get_user(mock_session, mock_result, repo):
+    mock_user = User(id=1)
+    
+    # Set up return value for execute method
+    mock_result.scalar_one_or_none.return_value = mock_user
     
-    async def test_get_user(self):
-        # Create mocks for objects
-        mock_session = AsyncMock()
-        mock_user = User(id=1)
-        
-        # Set up return value for execute method
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_user
-        mock_session.execute.return_value = mock_result
-        
-        # Create repository instance
-        repo = UserRepository(mock_session)
-        
-        # Call the tested method
-        result = await repo.get_user(1)
-        
-        # Check the result
-        assert result == mock_user
-        # Check that execute method was called
-        mock_session.execute.assert_called_once()
+    # Call the tested method
+    result = await repo.get_user(1)
     
-    async def test_get_user_by_email(self):
-        # Create mocks for objects
-        mock_session = AsyncMock()
-        mock_user = User(id=1, email="test@example.com")
-        
-        # Set up return value for execute method
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_user
-        mock_session.execute.return_value = mock_result
-        
-        # Create repository instance
-        repo = UserRepository(mock_session)
-        
-        # Call the tested method
-        result = await repo.get_user_by_email("test@example.com")
-        
-        # Check the result
-        assert result == mock_user
-        # Check that execute method was called
-        mock_session.execute.assert_called_once()
+    # Check the result
+    assert result == mock_user
+    # Check that execute method was called
+    mock_session.execute.assert_called_once()
+
+async def test_get_user_by_email(mock_session, mock_result, repo):
+    mock_user = User(id=1, email="test@example.com")
+    
+    # Set up return value for execute method
+    mock_result.scalar_one_or_none.return_value = mock_user
+    
+    # Call the tested method
+    result = await repo.get_user_by_email("test@example.com")
     
-    async def test_create_user(self):
-        # Create mocks for objects
-        mock_session = AsyncMock()
-        mock_user = User(id=1, username="testuser", email="test@example.com")
-        
-        # Patch User model
-        with patch('src.repository.users.User') as mock_user_model:
-            mock_user_model.return_value = mock_user
-            
-            # Create repository instance
-            repo = UserRepository(mock_session)
-            
-            # Create user data
-            user_data = UserCreate(username="testuser", email="test@example.com", password="password123")
-            
-            # Call the tested method
-            result = await repo.create_user(user_data)
-            
-            # Check the result
-            assert result == mock_user
-            # Check that session methods were called
-            mock_session.add.assert_called_once_with(mock_user)
-            mock_session.commit.assert_called_once()
-            mock_session.refresh.assert_called_once_with(mock_user)
+    # Check the result
+    assert result == mock_user
+    # Check that execute method was called
+    mock_session.execute.assert_called_once()
+
+async def test_create_user(monkeypatch, mock_session, repo, user_create_body):
+    mock_user = User(id=1, username="testuser", email="test@example.com")
+    
+    # Swap the model via monkeypatch: a lambda factory is lighter
+    # than a MagicMock posing as a class, teardown is automatic
+    monkeypatch.setattr(
+        "src.repository.users.User", lambda **kwargs: mock_user
+    )
     
-    async def test_update_avatar_url(self):
-        # Create mocks for objects
-        mock_session = AsyncMock()
-        mock_user = User(id=1, email="test@example.com")
-        
-        # Set up return value for execute method
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_user
-        mock_session.execute.return_value = mock_result
-        
-        # Create repository instance
-        repo = UserRepository(mock_session)
-        
-        # Call the tested method
-        avatar_url = "https://example.com/avatar.jpg"
-        result = await repo.update_avatar_url("test@example.com", avatar_url)
-        
-        # Check the result
-        assert result == mock_user
-        assert mock_user.avatar == avatar_url
-        # Check that session methods were called
-        mock_session.commit.assert_called_once()
+    # Call the tested method
+    result = await repo.create_user(user_create_body)
     
-    async def test_confirmed_email(self):
-        # Create mocks for objects
-        mock_session = AsyncMock()
-        mock_user = User(id=1, email="test@example.com", confirmed=False)
-        
-        # Set up return value for execute method
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_user
-        mock_session.execute.return_value = mock_result
-        
-        # Create repository instance
-        repo = UserRepository(mock_session)
-        
-        # Call the tested method
-        result = await repo.confirmed_email("test@example.com")
-        
-        # Check the result
-        assert mock_user.confirmed == True
-        # Check that session methods were called
-        mock_session.commit.assert_called_once() 
\ No newline at end of file
+    # Check the result
+    assert result == mock_user
+    # Check that session methods were called
+    mock_session.add.assert_called_once_with(mock_user)
+    mock_session.commit.assert_called_once()
+    mock_session.refresh.assert_called_once_with(mock_user)
+
+async def test_update_avatar_url(mock_session, mock_result, repo):
+    mock_user = User(id=1, email="test@example.com", avatar="https://example.com/avatar.jpg")
+
+    # Set up return value for execute method (UPDATE ... RETURNING)
+    mock_result.scalar_one_or_none.return_value = mock_user
+
+    # Call the tested method
+    avatar_url = "https://example.com/avatar.jpg"
+    result = await repo.update_avatar_url("test@example.com", avatar_url)
+
+    # Check the result
+    assert result == mock_user
+    # Check that a single UPDATE was issued and committed
+    mock_session.execute.assert_called_once()
+    mock_session.expunge.assert_called_once_with(mock_user)
+    mock_session.commit.assert_called_once()
+
+async def test_confirmed_email(mock_session, repo):
+    # Call the tested method
+    await repo.confirmed_email("test@example.com")
+
+    # Check that a single UPDATE was issued without a prior SELECT
+    mock_session.execute.assert_called_once()
+    mock_session.commit.assert_called_once() 
\ No newline at end of file
@@ -3,98 +3,123 @@ from datetime import date
 from pydantic import ValidationError
 
 from src.schemas import (
-    UserBase, UserCreate, UserResponse, 
+    UserBase, UserCreate, UserResponse,
     ContactModel, ContactUpdate, ContactResponse
 )
 
+BIRTHDAY = date(1990, 1, 1)
 
-def test_user_base():
-    """Test UserBase model"""
-    # Create correct object
-    user = UserBase(
-        username="testuser",
-        email="test@example.com"
-    )
-    
-    # Check attributes
-    assert user.username == "testuser"
-    assert user.email == "test@example.com"
-    
-    # Check email validation
-    with pytest.raises(ValidationError):
-        UserBase(
-            username="testuser",
-            email="invalid-email"  # Invalid email
-        )
 
+# Happy-path instances are immutable inputs shared by the asserts below,
+# so each model runs its validators once per module instead of per test.
 
-def test_user_create():
-    """Test UserCreate model"""
-    # Create correct object
-    user = UserCreate(
+@pytest.fixture(scope="module")
+def user_base():
+    return UserBase(username="testuser", email="test@example.com")
+
+
+@pytest.fixture(scope="module")
+def user_create():
+    return UserCreate(
         username="testuser",
         email="test@example.com",
         password="password123"
     )
-    
-    # Check attributes
-    assert user.username == "testuser"
-    assert user.email == "test@example.com"
-    assert user.password == "password123"
 
 
-def test_user_response():
-    """Test UserResponse model"""
-    # Create correct object
-    user = UserResponse(
+@pytest.fixture(scope="module")
+def user_response():
+    return UserResponse(
         id=1,
         username="testuser",
         email="test@example.com",
-        avatar=None
+        avatar=None,
+        role="user"
     )
-    
-    # Check attributes
-    assert user.id == 1
-    assert user.username == "testuser"
-    assert user.email == "test@example.com"
-    assert user.avatar is None
 
 
-def test_contact_model():
-    """Test ContactModel model"""
-    # Create correct object
-    birthday_date = date(1990, 1, 1)
-    contact = ContactModel(
+@pytest.fixture(scope="module")
+def contact_model():
+    return ContactModel(
         name="John",
         surname="Doe",
         email="john@example.com",
         phone="1234567890",
-        birthday=birthday_date
+        birthday=BIRTHDAY
     )
-    
-    # Check attributes
-    assert contact.name == "John"
-    assert contact.surname == "Doe"
-    assert contact.email == "john@example.com"
-    assert contact.phone == "1234567890"
-    assert contact.birthday == birthday_date
-    
-    # Check email validation
+
+
+@pytest.fixture(scope="module")
+def contact_response():
+    return ContactResponse(
+        id=1,
+        name="John",
+        surname="Doe",
+        email="john@example.com",
+        phone="1234567890",
+        birthday=BIRTHDAY,
+        additional_data="Some notes",
+        user_id=1
+    )
+
+
+def test_user_base(user_base):
+    """Test UserBase model"""
+    assert user_base.username == "testuser"
+    assert user_base.email == "test@example.com"
+
+
+def test_user_create(user_create):
+    """Test UserCreate model"""
+    assert user_create.username == "testuser"
+    assert user_create.email == "test@example.com"
+    assert user_create.password == "password123"
+
+
+def test_user_response(user_response):
+    """Test UserResponse model"""
+    assert user_response.id == 1
+    assert user_response.username == "testuser"
+    assert user_response.email == "test@example.com"
+    assert user_response.avatar is None
+    assert user_response.role == "user"
+
+
+def test_contact_model(contact_model):
+    """Test ContactModel model"""
+    assert contact_model.name == "John"
+    assert contact_model.surname == "Doe"
+    assert contact_model.email == "john@example.com"
+    assert contact_model.phone == "1234567890"
+    assert contact_model.birthday == BIRTHDAY
+
+
+@pytest.mark.parametrize(
+    "model,kwargs",
+    [
+        (UserBase, {"username": "testuser"}),
+        (
+            ContactModel,
+            {
+                "name": "John",
+                "surname": "Doe",
+                "phone": "1234567890",
+                "birthday": BIRTHDAY,
+            },
+        ),
+    ],
+)
+def test_invalid_email_rejected(model, kwargs):
+    """Email validation fails for malformed addresses"""
     with pytest.raises(ValidationError):
-        ContactModel(
-            name="John",
-            surname="Doe",
-            email="invalid-email",  # Invalid email
-            phone="1234567890",
-            birthday=birthday_date
-        )
+        model(email="invalid-email", **kwargs)
 
 
 def test_contact_update():
     """Test ContactUpdate model"""
     # Create correct object with partial data
     contact = ContactUpdate(name="John")
-    
+
     # Check attributes
     assert contact.name == "John"
     assert contact.surname is None
@@ -104,27 +129,13 @@ def test_contact_update():
     assert contact.additional_data is None
 
 
-def test_contact_response():
+def test_contact_response(contact_response):
     """Test ContactResponse model"""
-    # Create correct object
-    birthday_date = date(1990, 1, 1)
-    contact = ContactResponse(
-        id=1,
-        name="John",
-        surname="Doe",
-        email="john@example.com",
-        phone="1234567890",
-        birthday=birthday_date,
-        additional_data="Some notes",
-        user_id=1
-    )
-    
-    # Check attributes
-    assert contact.id == 1
-    assert contact.name == "John"
-    assert contact.surname == "Doe"
-    assert contact.email == "john@example.com"
-    assert contact.phone == "1234567890"
-    assert contact.birthday == birthday_date
-    assert contact.additional_data == "Some notes"
-    assert contact.user_id == 1 
\ No newline at end of file
+    assert contact_response.id == 1
+    assert contact_response.name == "John"
+    assert contact_response.surname == "Doe"
+    assert contact_response.email == "john@example.com"
+    assert contact_response.phone == "1234567890"
+    assert contact_response.birthday == BIRTHDAY
+    assert contact_response.additional_data == "Some notes"
+    assert contact_response.user_id == 1
@@ -1,151 +1,82 @@
 import pytest
-import unittest.mock
-from unittest.mock import AsyncMock, patch, MagicMock
-from datetime import date, timedelta
-
-from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import AsyncMock, sentinel
 
 from src.services.contacts import ContactService
 from src.repository.contacts import ContactRepository
-from src.schemas import ContactModel, ContactUpdate
 
 
-@pytest.mark.asyncio
 class TestContactsService:
-    async def test_get_contacts(self):
-        # Create mock for contacts repository
-        mock_repo = AsyncMock()
-        # Specify return value for get_contacts method
-        mock_contacts = [MagicMock(id=1), MagicMock(id=2)]
-        mock_repo.get_contacts = AsyncMock(return_value=mock_contacts)
-        
-        # Create service instance with repository mock
-        service = ContactService(mock_repo)
-        
-        # Call the tested method
-        result = await service.get_contacts(0, 10, 1)
-        
-        # Check that the result matches expected
-        assert result == mock_contacts
-        # Check that repository method was called with correct parameters
-        mock_repo.get_contacts.assert_called_once_with(0, 10, 1)
-    
-    async def test_get_contact(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for get_contact_by_id method
-        mock_contact = MagicMock(id=1)
-        mock_repo.get_contact_by_id = AsyncMock(return_value=mock_contact)
-        
-        # Create service instance with repository mock
-        service = ContactService(mock_repo)
-        
-        # Call the tested method
-        result = await service.get_contact(1, 1)
-        
-        # Check result
-        assert result == mock_contact
-        # Check that repository method was called with correct parameters
-        mock_repo.get_contact_by_id.assert_called_once_with(1, 1)
-    
-    async def test_create_contact(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for create_contact method
-        mock_contact = MagicMock(id=1)
-        mock_repo.create_contact = AsyncMock(return_value=mock_contact)
-        
-        # Create data for contact creation
-        contact_data = ContactModel(
-            name="Test",
-            surname="Contact",
-            email="test@example.com",
-            phone="1234567890",
-            birthday=date(1990, 1, 1)
-        )
-        
-        # Create service instance with repository mock
-        service = ContactService(mock_repo)
-        
-        # Call the tested method
-        result = await service.create_contact(contact_data, 1)
-        
-        # Check result
-        assert result == mock_contact
-        # Check that repository method was called with correct parameters
-        mock_repo.create_contact.assert_called_once_with(contact_data, 1)
-    
-    async def test_update_contact(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for update_contact method
-        mock_contact = MagicMock(id=1)
-        mock_repo.update_contact = AsyncMock(return_value=mock_contact)
-        
-        # Create data for contact update
-        contact_update = ContactUpdate(name="Updated")
-        
-        # Create service instance with repository mock
-        service = ContactService(mock_repo)
-        
-        # Call the tested method
-        result = await service.update_contact(1, contact_update, 1)
-        
-        # Check result
-        assert result == mock_contact
-        # Check that repository method was called with correct parameters
-        mock_repo.update_contact.assert_called_once_with(1, contact_update, 1)
-    
-    async def test_delete_contact(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for delete_contact method
-        mock_contact = MagicMock(id=1)
-        mock_repo.delete_contact = AsyncMock(return_value=mock_contact)
-        
-        # Create service instance with repository mock
-        service = ContactService(mock_repo)
-        
-        # Call the tested method
-        result = await service.delete_contact(1, 1)
-        
-        # Check result
-        assert result == mock_contact
-        # Check that repository method was called with correct parameters
-        mock_repo.delete_contact.assert_called_once_with(1, 1)
+    @pytest.fixture(scope="class")
+    def _repo_proto(self):
+        """Spec'd AsyncMock built once per class: spec pins the mock to
+        the real repository API so misspelled methods fail instead of
+        passing, and construction cost is paid once"""
+        return AsyncMock(spec=ContactRepository)
+
+    @pytest.fixture
+    def mock_repo(self, _repo_proto):
+        """Per-test view of the prototype: resetting calls and return
+        values is far cheaper than rebuilding the AsyncMock graph"""
+        _repo_proto.reset_mock(return_value=True, side_effect=True)
+        return _repo_proto
+
+    @pytest.fixture
+    def service(self, mock_repo, db_sentinel):
+        """Service wired to the repository mock instead of the real
+        ContactRepository the constructor builds"""
+        service = ContactService(db_sentinel)
+        service.repository = mock_repo
+        return service
+
+    @pytest.mark.parametrize(
+        "service_method,repo_method,args",
+        [
+            ("get_contacts", "get_contacts", (0, 10, 1)),
+            ("get_contact", "get_contact_by_id", (1, 1)),
+            ("delete_contact", "delete_contact", (1, 1)),
+            ("search_contacts", "search_contacts", ("test", 1)),
+            ("get_contacts_by_birthday", "get_contacts_by_birthday", (7, 1)),
+        ],
+    )
+    async def test_delegates_to_repository(
+        self, mock_repo, service, service_method, repo_method, args
+    ):
+        # The service is a thin wrapper: one body covers every method
+        # that forwards its arguments unchanged. sentinel is a free
+        # singleton, so the identity check costs nothing to set up.
+        getattr(mock_repo, repo_method).return_value = sentinel.result
+
+        result = await getattr(service, service_method)(*args)
+
+        assert result is sentinel.result
+        getattr(mock_repo, repo_method).assert_called_once_with(*args)
     
-    async def test_search_contacts(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for search_contacts method
-        mock_contacts = [MagicMock(id=1), MagicMock(id=2)]
-        mock_repo.search_contacts = AsyncMock(return_value=mock_contacts)
-        
-        # Create service instance with repository mock
-        service = ContactService(mock_repo)
+    async def test_create_contact(self, mock_repo, service, contact_model_body):
+        # Specify return value for create_contact method; the result is
+        # only identity-checked, so a free sentinel singleton suffices
+        mock_repo.create_contact.return_value = sentinel.contact
         
         # Call the tested method
-        result = await service.search_contacts("test", 1)
+        result = await service.create_contact(contact_model_body, 1)
         
         # Check result
-        assert result == mock_contacts
-        # Check that repository method was called with correct parameters
-        mock_repo.search_contacts.assert_called_once_with("test", 1)
+        assert result is sentinel.contact
+        # Identity check on the model argument skips pydantic field-by-field __eq__
+        mock_repo.create_contact.assert_called_once()
+        args = mock_repo.create_contact.call_args.args
+        assert args[0] is contact_model_body and args[1] == 1
     
-    async def test_get_contacts_by_birthday(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for get_contacts_by_birthday method
-        mock_contacts = [MagicMock(id=1), MagicMock(id=2)]
-        mock_repo.get_contacts_by_birthday = AsyncMock(return_value=mock_contacts)
-        
-        # Create service instance with repository mock
-        service = ContactService(mock_repo)
+    async def test_update_contact(self, mock_repo, service, contact_update_body):
+        # Specify return value for update_contact method; the result is
+        # only identity-checked, so a free sentinel singleton suffices
+        mock_repo.update_contact.return_value = sentinel.contact
         
         # Call the tested method
-        result = await service.get_contacts_by_birthday(7, 1)
+        result = await service.update_contact(1, contact_update_body, 1)
         
         # Check result
-        assert result == mock_contacts
-        # Check that repository method was called with correct parameters
-        mock_repo.get_contacts_by_birthday.assert_called_once_with(7, 1) 
\ No newline at end of file
+        assert result is sentinel.contact
+        # Identity check on the model argument skips pydantic field-by-field __eq__
+        mock_repo.update_contact.assert_called_once()
+        args = mock_repo.update_contact.call_args.args
+        assert args[0] == 1 and args[1] is contact_update_body and args[2] == 1
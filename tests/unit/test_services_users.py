@@ -1,142 +1,78 @@
 import pytest
-import unittest.mock
-from unittest.mock import AsyncMock, MagicMock
-
-from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import AsyncMock, sentinel
 
 from src.services.users import UserService
 from src.repository.users import UserRepository
-from src.schemas import UserCreate, UserResponse
 
 
-@pytest.mark.asyncio
 class TestUserService:
-    async def test_create_user(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for create_user method
-        mock_user = MagicMock(id=1)
-        mock_repo.create_user = AsyncMock(return_value=mock_user)
-        
-        # Create user data
-        user_data = UserCreate(
-            username="testuser",
-            email="test@example.com",
-            password="password123"
-        )
-        
-        # Create service instance with repository mock
-        service = UserService(mock_repo)
-        
-        # Call the tested method
-        result = await service.create_user(user_data)
-        
-        # Check result
-        assert result == mock_user
-        # Check that repository method was called with correct parameters
-        mock_repo.create_user.assert_called_once_with(user_data)
-    
-    async def test_get_user_by_email(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for get_user_by_email method
-        mock_user = MagicMock(id=1)
-        mock_repo.get_user_by_email = AsyncMock(return_value=mock_user)
-        
-        # Create service instance with repository mock
-        service = UserService(mock_repo)
-        
-        # Call the tested method
-        result = await service.get_user_by_email("test@example.com")
-        
-        # Check result
-        assert result == mock_user
-        # Check that repository method was called with correct parameters
-        mock_repo.get_user_by_email.assert_called_once_with("test@example.com")
-    
-    async def test_get_user_by_username(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for get_user_by_username method
-        mock_user = MagicMock(id=1)
-        mock_repo.get_user_by_username = AsyncMock(return_value=mock_user)
-        
-        # Create service instance with repository mock
-        service = UserService(mock_repo)
+    @pytest.fixture(scope="class")
+    def _repo_proto(self):
+        """Spec'd AsyncMock built once per class: spec pins the mock to
+        the real repository API so misspelled methods fail instead of
+        passing, and construction cost is paid once"""
+        return AsyncMock(spec=UserRepository)
+
+    @pytest.fixture
+    def mock_repo(self, _repo_proto):
+        """Per-test view of the prototype: resetting calls and return
+        values is far cheaper than rebuilding the AsyncMock graph"""
+        _repo_proto.reset_mock(return_value=True, side_effect=True)
+        return _repo_proto
+
+    @pytest.fixture
+    def service(self, mock_repo, db_sentinel):
+        """Service wired to the repository mock instead of the real
+        UserRepository the constructor builds"""
+        service = UserService(db_sentinel)
+        service.repository = mock_repo
+        return service
+
+    async def test_create_user(self, mock_repo, service, user_create_body):
+        # Specify return value for create_user method; the result is
+        # only identity-checked, so a free sentinel singleton suffices
+        mock_repo.create_user.return_value = sentinel.user
         
         # Call the tested method
-        result = await service.get_user_by_username("testuser")
+        result = await service.create_user(user_create_body)
         
         # Check result
-        assert result == mock_user
-        # Check that repository method was called with correct parameters
-        mock_repo.get_user_by_username.assert_called_once_with("testuser")
+        assert result is sentinel.user
+        # Identity check on the model argument skips pydantic field-by-field __eq__
+        mock_repo.create_user.assert_called_once()
+        assert mock_repo.create_user.call_args.args[0] is user_create_body
     
-    async def test_get_users(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for get_users method
-        mock_users = [MagicMock(id=1), MagicMock(id=2)]
-        mock_repo.get_users = AsyncMock(return_value=mock_users)
-        
-        # Create service instance with repository mock
-        service = UserService(mock_repo)
+    @pytest.mark.parametrize(
+        "method,args",
+        [
+            ("get_user_by_email", ("test@example.com",)),
+            ("get_user_by_username", ("testuser",)),
+            ("get_user", (1,)),
+            ("confirmed_email", ("test@example.com",)),
+            ("update_avatar_url", ("test@example.com", "https://example.com/avatar.jpg")),
+        ],
+    )
+    async def test_delegates_to_repository(self, mock_repo, service, method, args):
+        # The service is a thin wrapper: one body covers every method
+        # that forwards its arguments unchanged. sentinel is a free
+        # singleton, so the identity check costs nothing to set up.
+        getattr(mock_repo, method).return_value = sentinel.result
+
+        result = await getattr(service, method)(*args)
+
+        assert result is sentinel.result
+        getattr(mock_repo, method).assert_called_once_with(*args)
+
+    async def test_get_users(self, mock_repo, service):
+        # Specify return value for get_users method; sentinel items in
+        # a plain list avoid two mock constructions
+        mock_users = [sentinel.user1, sentinel.user2]
+        mock_repo.get_users.return_value = mock_users
         
         # Call the tested method
         result = await service.get_users()
         
         # Check result
-        assert result == mock_users
+        assert result is mock_users
         # Check that repository method was called
         mock_repo.get_users.assert_called_once()
-    
-    async def test_get_user(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for get_user method
-        mock_user = MagicMock(id=1)
-        mock_repo.get_user = AsyncMock(return_value=mock_user)
-        
-        # Create service instance with repository mock
-        service = UserService(mock_repo)
-        
-        # Call the tested method
-        result = await service.get_user(1)
-        
-        # Check result
-        assert result == mock_user
-        # Check that repository method was called with correct parameters
-        mock_repo.get_user.assert_called_once_with(1)
-    
-    async def test_confirmed_email(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for confirmed_email method
-        mock_repo.confirmed_email = AsyncMock(return_value=True)
-        
-        # Create service instance with repository mock
-        service = UserService(mock_repo)
-        
-        # Call the tested method
-        await service.confirmed_email("test@example.com")
-        
-        # Check that repository method was called with correct parameters
-        mock_repo.confirmed_email.assert_called_once_with("test@example.com")
-    
-    async def test_update_avatar_url(self):
-        # Create mock for repository
-        mock_repo = AsyncMock()
-        # Specify return value for update_avatar_url method
-        mock_user = MagicMock(id=1, avatar="https://example.com/avatar.jpg")
-        mock_repo.update_avatar_url = AsyncMock(return_value=mock_user)
-        
-        # Create service instance with repository mock
-        service = UserService(mock_repo)
-        
-        # Call the tested method
-        result = await service.update_avatar_url("test@example.com", "https://example.com/avatar.jpg")
-        
-        # Check result
-        assert result == mock_user
-        # Check that repository method was called with correct parameters
-        mock_repo.update_avatar_url.assert_called_once_with("test@example.com", "https://example.com/avatar.jpg") 
\ No newline at end of file
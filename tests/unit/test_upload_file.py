@@ -1,10 +1,26 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi import UploadFile
-
+from unittest.mock import MagicMock
 from src.services.upload_file import UploadFileService
 
 
+@pytest.fixture(scope="module")
+def _cloudinary_proto():
+    """Cloudinary module stub built once per module: pure configuration"""
+    cloudinary = MagicMock()
+    cloudinary.uploader.upload.return_value = {"version": "1234"}
+    cloudinary.CloudinaryImage.return_value.build_url.return_value = (
+        "https://example.com/image.jpg"
+    )
+    return cloudinary
+
+
+@pytest.fixture
+def mock_cloudinary(_cloudinary_proto):
+    """Per-test view of the stub: call history reset, wiring shared"""
+    _cloudinary_proto.uploader.upload.reset_mock()
+    return _cloudinary_proto
+
+
 def test_upload_file_service_init():
     """Test initialization of file upload service"""
     # Create service with test settings
@@ -13,53 +29,36 @@ def test_upload_file_service_init():
         api_key="test_key",
         api_secret="test_secret"
     )
-    
+
     # Check attributes
     assert service.cloud_name == "test_cloud"
     assert service.api_key == "test_key"
     assert service.api_secret == "test_secret"
 
 
-def test_upload_file():
+def test_upload_file(monkeypatch, mock_cloudinary, upload_file_mock):
     """Test file upload function"""
-    # Create mock for Cloudinary
-    mock_cloudinary_uploader = MagicMock()
-    mock_cloudinary_uploader.upload = MagicMock(return_value={"version": "1234"})
-    
-    mock_cloudinary_image = MagicMock()
-    mock_cloudinary_image.build_url = MagicMock(return_value="https://example.com/image.jpg")
-    
-    mock_cloudinary = MagicMock()
-    mock_cloudinary.uploader = mock_cloudinary_uploader
-    mock_cloudinary.CloudinaryImage = MagicMock(return_value=mock_cloudinary_image)
-    
     # Create file upload service
     service = UploadFileService(
         cloud_name="test_cloud",
         api_key="test_key",
         api_secret="test_secret"
     )
-    
-    # Create mock for file
-    mock_file = MagicMock(spec=UploadFile)
-    mock_file.file = MagicMock()
-    mock_file.filename = "test.jpg"
-    
-    # Patch Cloudinary module
-    with (
-        patch("src.services.upload_file.cloudinary", mock_cloudinary),
-        patch("src.services.upload_file.cloudinary.uploader", mock_cloudinary_uploader),
-        patch("src.services.upload_file.cloudinary.CloudinaryImage", lambda _: mock_cloudinary_image)
-    ):
-        # Call the tested function
-        result = service.upload_file(mock_file, "test_user")
-        
-        # Check result
-        assert result == "https://example.com/image.jpg"
-        
-        # Check that Cloudinary.uploader.upload was called with correct parameters
-        mock_cloudinary_uploader.upload.assert_called_once()
-        args, kwargs = mock_cloudinary_uploader.upload.call_args
-        assert args[0] == mock_file.file
-        assert kwargs["public_id"] == "ContactsApp/test_user"
-        assert kwargs["overwrite"] is True 
\ No newline at end of file
+
+    # One setattr with automatic teardown replaces the three stacked
+    # patch() context managers; uploader and CloudinaryImage are
+    # reached through the same module attribute
+    monkeypatch.setattr("src.services.upload_file.cloudinary", mock_cloudinary)
+
+    # Call the tested function
+    result = service.upload_file(upload_file_mock, "test_user")
+
+    # Check result
+    assert result == "https://example.com/image.jpg"
+
+    # Check that Cloudinary.uploader.upload was called with correct parameters
+    mock_cloudinary.uploader.upload.assert_called_once()
+    args, kwargs = mock_cloudinary.uploader.upload.call_args
+    assert args[0] == upload_file_mock.file
+    assert kwargs["public_id"] == "ContactsApp/test_user"
+    assert kwargs["overwrite"] is True
@@ -1,47 +1,58 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi import UploadFile, File
+from unittest.mock import AsyncMock, MagicMock
 
-from src.api.users import router
+from src.api import users as users_module
+from src.api.users import update_avatar
+from src.services.users import UserService
+
+AVATAR_URL = "https://example.com/avatar.jpg"
+
+
+async def _noop_invalidate_cache(username):
+    """Constant async stub: far cheaper to construct than an AsyncMock
+    and nothing asserts on the call"""
+    return None
 
 
 @pytest.fixture
 def mock_user():
     """Mock user for tests"""
-    return MagicMock(id=1, email="test@example.com")
+    return MagicMock(id=1, email="test@example.com", username="testuser")
 
 
 @pytest.fixture
 def mock_user_service():
-    """Mock user service"""
-    service = MagicMock()
-    service.update_avatar_url = AsyncMock()
-    return service
-
-
-def test_upload_avatar(monkeypatch, mock_user, mock_user_service):
-    """Test uploading user avatar"""
-    # Create a mock for the file
-    file = MagicMock(spec=UploadFile)
-    
-    # Mock for file upload service
-    mock_upload_file = AsyncMock(return_value="https://example.com/avatar.jpg")
-    monkeypatch.setattr("src.api.users.upload_file", mock_upload_file)
-    
-    # Mock for user service
-    updated_user = MagicMock(avatar="https://example.com/avatar.jpg")
+    """Mock user service, spec'd against the real class like the auth
+    API tests; child method mocks are created lazily"""
+    return AsyncMock(spec=UserService)
+
+
+async def test_update_avatar(monkeypatch, mock_user, mock_user_service, upload_file_mock):
+    """Test updating user avatar via the endpoint called directly:
+    awaiting it on the shared loop avoids an asyncio.run cycle and
+    dependency overrides are unnecessary with explicit mocks"""
+    upload_file_mock.content_type = "image/jpeg"
+
+    # Cloudinary service does a blocking HTTP call - stub it out
+    mock_upload_service = MagicMock()
+    mock_upload_service.upload_file.return_value = AVATAR_URL
+    monkeypatch.setattr(
+        users_module, "UploadFileService", lambda *args: mock_upload_service
+    )
+
+    updated_user = MagicMock(avatar=AVATAR_URL)
     mock_user_service.update_avatar_url.return_value = updated_user
-    
-    # Override dependencies
-    monkeypatch.setattr("src.api.users.get_user_service", lambda: mock_user_service)
-    
-    # Call the tested function through a coroutine
-    import asyncio
-    result = asyncio.run(router.dependency_overrides[{}]["upload_avatar"](file, mock_user))
-    
+    monkeypatch.setattr(users_module, "UserService", lambda db: mock_user_service)
+    monkeypatch.setattr(users_module, "invalidate_user_cache", _noop_invalidate_cache)
+
+    # Call the endpoint function directly
+    result = await update_avatar(upload_file_mock, mock_user, db=MagicMock())
+
     # Check the result
-    assert result == updated_user
-    mock_upload_file.assert_called_once_with(file)
+    assert result is updated_user
+    mock_upload_service.upload_file.assert_called_once_with(
+        upload_file_mock, mock_user.username
+    )
     mock_user_service.update_avatar_url.assert_called_once_with(
-        mock_user.email, "https://example.com/avatar.jpg"
-    ) 
\ No newline at end of file
+        mock_user.email, AVATAR_URL
+    )
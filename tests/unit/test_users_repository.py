@@ -1,157 +1,138 @@
 import pytest
-from datetime import datetime
-import unittest.mock
+from types import MappingProxyType
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert
 
 from src.database.models import User
-from src.repository.users import UserRepository
 from src.schemas import UserCreate
+from src.repository.users import UserRepository
+from tests._helpers import persist
+
+# Seed data built once at import, read-only behind MappingProxyType —
+# same pattern as the contact repository tests
+USERS_BULK = tuple(MappingProxyType(d) for d in (
+    {"username": "test1", "email": "test1@example.com", "hashed_password": "password1"},
+    {"username": "test2", "email": "test2@example.com", "hashed_password": "password2"},
+))
+
+USER_CONFIRM = MappingProxyType(
+    {"username": "confirm_user", "email": "confirm@example.com", "hashed_password": "password", "confirmed": False}
+)
+
+USER_AVATAR = MappingProxyType(
+    {"username": "avatar_user", "email": "avatar@example.com", "hashed_password": "password"}
+)
+
+async def test_get_users(async_session):
+    # Arrange
+    user_repo = UserRepository(async_session)
+    # Session-lived fixture rows (e.g. the shared repository user) may
+    # already exist, so count relative to the current state
+    existing = {user.username for user in await user_repo.get_users()}
+    # Core executemany skips unit-of-work tracking for rows the test
+    # never touches through the ORM again
+    await async_session.execute(insert(User), [dict(u) for u in USERS_BULK])
+
+    # Act
+    users = await user_repo.get_users()
+
+    # Assert
+    assert len(users) == len(existing) + 2
+    usernames = {user.username for user in users}
+    assert {"test1", "test2"} <= usernames
+
+
+async def test_get_nonexistent_user(async_session):
+    # Arrange
+    user_repo = UserRepository(async_session)
+    
+    # Act
+    result = await user_repo.get_user(999)
+    
+    # Assert
+    assert result is None
+
+@pytest.fixture
+async def seeded_user(async_session):
+    """One canonical user shared by the lookup tests below"""
+    return await persist(async_session, User(
+        username="lookup_user",
+        email="lookup@example.com",
+        hashed_password="password",
+    ))
+
+@pytest.mark.parametrize(
+    "method,attr",
+    [
+        ("get_user", "id"),
+        ("get_user_by_email", "email"),
+        ("get_user_by_username", "username"),
+    ],
+)
+async def test_lookups(async_session, seeded_user, method, attr):
+    """The by-id/by-email/by-username lookups share one seeded row
+    and one test body instead of three copies of the scaffolding"""
+    # Arrange
+    user_repo = UserRepository(async_session)
+    
+    # Act
+    result = await getattr(user_repo, method)(getattr(seeded_user, attr))
+    
+    # Assert
+    assert result is not None
+    assert result.id == seeded_user.id
+    assert result.username == seeded_user.username
+
 
-@pytest.mark.asyncio
-class TestUserRepository:
-    async def test_get_users(self, async_session):
-        # Arrange
-        user_repo = UserRepository(async_session)
-        users_data = [
-            {"username": "test1", "email": "test1@example.com", "hashed_password": "password1"},
-            {"username": "test2", "email": "test2@example.com", "hashed_password": "password2"}
-        ]
-        for user_data in users_data:
-            async_session.add(User(**user_data))
-        await async_session.commit()
-        
-        # Act
-        users = await user_repo.get_users()
-        
-        # Assert
-        assert len(users) == 2
-        assert users[0].username == "test1"
-        assert users[1].username == "test2"
+async def test_create_user(async_session):
+    # Arrange - model_construct skips pydantic validation (EmailStr is
+    # the expensive part) for known-good literal data; the schema itself
+    # is covered by the full constructor in test_schemas.py
+    user_repo = UserRepository(async_session)
+    user_data = UserCreate.model_construct(
+        username="new_user", email="new@example.com", password="securepassword"
+    )
     
-    async def test_get_user(self, async_session):
-        # Arrange
-        user_repo = UserRepository(async_session)
-        user_data = {"username": "test_user", "email": "test@example.com", "hashed_password": "password"}
-        user = User(**user_data)
-        async_session.add(user)
-        await async_session.commit()
-        await async_session.refresh(user)
-        
-        # Act
-        result = await user_repo.get_user(user.id)
-        
-        # Assert
-        assert result is not None
-        assert result.username == user_data["username"]
-        assert result.email == user_data["email"]
+    # Act
+    user = await user_repo.create_user(user_data)
     
-    async def test_get_nonexistent_user(self, async_session):
-        # Arrange
-        user_repo = UserRepository(async_session)
-        
-        # Act
-        result = await user_repo.get_user(999)
-        
-        # Assert
-        assert result is None
+    # Assert
+    assert user.username == user_data.username
+    assert user.email == user_data.email
+    assert user.hashed_password == user_data.password  # In the test, password is not hashed
+    # The returned ORM object is the flushed row itself; a second
+    # SELECT to re-verify it would be a redundant round-trip
+
+async def test_confirmed_email(async_session):
+    # Arrange
+    user_repo = UserRepository(async_session)
+    email = USER_CONFIRM["email"]
+    user = await persist(async_session, User(**USER_CONFIRM))
     
-    async def test_get_user_by_email(self, async_session):
-        # Arrange
-        user_repo = UserRepository(async_session)
-        email = "unique@example.com"
-        user_data = {"username": "unique_user", "email": email, "hashed_password": "password"}
-        user = User(**user_data)
-        async_session.add(user)
-        await async_session.commit()
-        
-        # Act
-        result = await user_repo.get_user_by_email(email)
-        
-        # Assert
-        assert result is not None
-        assert result.email == email
-        assert result.username == user_data["username"]
+    # Act
+    await user_repo.confirmed_email(email)
+    
+    # Assert - refresh by PK re-reads just the changed column
+    # instead of a filter_by scan in a separate query
+    await async_session.refresh(user, ["confirmed"])
+    assert user.confirmed is True
+
+async def test_update_avatar_url(async_session):
+    # Arrange
+    user_repo = UserRepository(async_session)
+    email = USER_AVATAR["email"]
+    user = await persist(async_session, User(**USER_AVATAR))
     
-    async def test_get_user_by_username(self, async_session):
-        # Arrange
-        user_repo = UserRepository(async_session)
-        username = "special_username"
-        user_data = {"username": username, "email": "special@example.com", "hashed_password": "password"}
-        user = User(**user_data)
-        async_session.add(user)
-        await async_session.commit()
-        
-        # Act
-        result = await user_repo.get_user_by_username(username)
-        
-        # Assert
-        assert result is not None
-        assert result.username == username
-        assert result.email == user_data["email"]
+    new_avatar_url = "https://example.com/avatar.jpg"
     
-    async def test_create_user(self, async_session):
-        # Arrange
-        user_repo = UserRepository(async_session)
-        user_data = UserCreate(
-            username="new_user",
-            email="new@example.com",
-            password="securepassword"
-        )
-        
-        # Act
-        user = await user_repo.create_user(user_data)
-        
-        # Assert
-        assert user.username == user_data.username
-        assert user.email == user_data.email
-        assert user.hashed_password == user_data.password  # In the test, password is not hashed
-        
-        # Check that the user is actually created in the database
-        stmt = select(User).filter_by(email=user_data.email)
-        result = await async_session.execute(stmt)
-        db_user = result.scalar_one_or_none()
-        assert db_user is not None
-        assert db_user.username == user_data.username
+    # Act
+    updated_user = await user_repo.update_avatar_url(email, new_avatar_url)
     
-    async def test_confirmed_email(self, async_session):
-        # Arrange
-        user_repo = UserRepository(async_session)
-        email = "confirm@example.com"
-        user_data = {"username": "confirm_user", "email": email, "hashed_password": "password", "confirmed": False}
-        user = User(**user_data)
-        async_session.add(user)
-        await async_session.commit()
-        
-        # Act
-        await user_repo.confirmed_email(email)
-        
-        # Assert
-        stmt = select(User).filter_by(email=email)
-        result = await async_session.execute(stmt)
-        updated_user = result.scalar_one_or_none()
-        assert updated_user.confirmed is True
+    # Assert
+    assert updated_user.avatar == new_avatar_url
     
-    async def test_update_avatar_url(self, async_session):
-        # Arrange
-        user_repo = UserRepository(async_session)
-        email = "avatar@example.com"
-        user_data = {"username": "avatar_user", "email": email, "hashed_password": "password"}
-        user = User(**user_data)
-        async_session.add(user)
-        await async_session.commit()
-        
-        new_avatar_url = "https://example.com/avatar.jpg"
-        
-        # Act
-        updated_user = await user_repo.update_avatar_url(email, new_avatar_url)
-        
-        # Assert
-        assert updated_user.avatar == new_avatar_url
-        
-        # Check that URL is actually updated in the database
-        stmt = select(User).filter_by(email=email)
-        result = await async_session.execute(stmt)
-        db_user = result.scalar_one_or_none()
-        assert db_user.avatar == new_avatar_url 
\ No newline at end of file
+    # Check that URL is actually updated in the database; the repo
+    # expunges the updated row and the session no longer expires on
+    # commit, so force a reload by PK
+    db_user = await async_session.get(User, user.id, populate_existing=True)
+    assert db_user.avatar == new_avatar_url 
\ No newline at end of file